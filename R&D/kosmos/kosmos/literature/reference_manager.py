@@ -8,10 +8,15 @@ Provides:
 - Library export to multiple formats
 """
 
+import functools
 import logging
 import json
+import os
+import re
 from typing import List, Dict, Any, Optional, Tuple, Set
+from collections import Counter
 from pathlib import Path
+from contextlib import contextmanager
 from difflib import SequenceMatcher
 import hashlib
 
@@ -20,6 +25,85 @@ from kosmos.literature.citations import CitationFormatter, papers_to_bibtex, pap
 
 logger = logging.getLogger(__name__)
 
+# Try to import rapidfuzz for vectorized fuzzy matching
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process as rf_process
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+    logger.debug(
+        "rapidfuzz not installed. Batch deduplication will use the slower "
+        "pairwise SequenceMatcher path. Install with: pip install rapidfuzz"
+    )
+
+# Numba kernels for very large libraries (optional, see _fuzzy_kernels)
+from kosmos.literature._fuzzy_kernels import NUMBA_AVAILABLE as NUMBA_KERNELS_AVAILABLE
+if NUMBA_KERNELS_AVAILABLE:
+    from kosmos.literature._fuzzy_kernels import encode_titles, pairwise_first_match
+
+# Library size above which the compiled Jaro-Winkler kernel beats rapidfuzz
+_NUMBA_DISPATCH_THRESHOLD = 10_000
+
+# Try to import orjson for fast serialization (stdlib json fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for streaming loads of large legacy libraries
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Try to import xxhash for fast non-cryptographic ID hashing (md5 fallback)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+def _short_hash(value: str) -> str:
+    """
+    8-hex-char hash for reference IDs.
+
+    Uses xxh64 when available (no cryptographic requirement here, and it is
+    several times faster than md5 on short strings). The md5 path is kept
+    for environments without xxhash; IDs already stored on disk load
+    unchanged either way since they are persisted with their records.
+    """
+    if XXHASH_AVAILABLE:
+        return f"{xxhash.xxh64_intdigest(value.encode()):016x}"[:8]
+    return hashlib.md5(value.encode()).hexdigest()[:8]
+
+
+if ORJSON_AVAILABLE:
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one JSONL record (newline-terminated bytes)."""
+        return orjson.dumps(obj) + b"\n"
+
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize with 2-space indentation."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+else:
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one JSONL record (newline-terminated bytes)."""
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+    def _dumps_indented(obj: Any) -> bytes:
+        """Serialize with 2-space indentation."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _loads = json.loads
+
 
 class ReferenceManager:
     """
@@ -51,15 +135,46 @@ class ReferenceManager:
         self.storage_path = Path(storage_path) if storage_path else None
         self.auto_deduplicate = auto_deduplicate
 
+        # JSONL storage appends one record per add; legacy .json rewrites
+        # the whole library on every save
+        self._is_jsonl = (
+            self.storage_path is not None
+            and self.storage_path.suffix == ".jsonl"
+        )
+
         # Storage: ref_id -> PaperMetadata
         self.references: Dict[str, PaperMetadata] = {}
 
-        # Citation relationships: citing_id -> [cited_ids]
-        self.citation_links: Dict[str, List[str]] = {}
+        # Citation relationships: citing_id -> {cited_ids}
+        self.citation_links: Dict[str, Set[str]] = {}
+
+        # Reverse adjacency: cited_id -> {citing_ids} for O(1)
+        # "who cites me" queries
+        self._reverse_citation_links: Dict[str, Set[str]] = {}
+
+        # Identifier indices for O(1) duplicate lookup: identifier -> ref_id
+        self._doi_index: Dict[str, str] = {}
+        self._arxiv_index: Dict[str, str] = {}
+        self._pubmed_index: Dict[str, str] = {}
+
+        # Full-text inverted index: lowercased token -> set of ref_ids
+        self._token_index: Dict[str, Set[str]] = {}
+
+        # Running statistics, updated incrementally on add/merge/dedup
+        self._stats: Dict[str, Any] = {
+            "doi_count": 0,
+            "arxiv_count": 0,
+            "pubmed_count": 0,
+            "year_distribution": Counter()
+        }
 
         # Deduplication engine
         self.dedup_engine = DeduplicationEngine()
 
+        # Batch-write state: suppress per-add saves inside buffered()
+        self._in_batch = False
+        self._dirty = False
+
         # Load from storage if exists
         if self.storage_path and self.storage_path.exists():
             self._load_from_storage()
@@ -87,6 +202,7 @@ class ReferenceManager:
             if existing_id:
                 logger.debug(f"Duplicate found, merging with {existing_id}")
                 self._merge_papers(existing_id, paper)
+                self._persist_merge(existing_id)
                 return existing_id
 
         # Generate reference ID
@@ -94,10 +210,15 @@ class ReferenceManager:
 
         # Store reference
         self.references[ref_id] = paper
+        self._index_reference(ref_id, paper)
+        self._stats_add(paper)
 
-        # Save to storage
+        # Save to storage (JSONL appends one line; JSON rewrites the file)
         if self.storage_path:
-            self._save_to_storage()
+            if self._is_jsonl:
+                self._append_to_storage(ref_id, paper)
+            else:
+                self._save_to_storage()
 
         logger.debug(f"Added reference: {ref_id}")
         return ref_id
@@ -120,13 +241,57 @@ class ReferenceManager:
         """
         ref_ids = []
 
-        for paper in papers:
-            ref_id = self.add_reference(paper)
-            ref_ids.append(ref_id)
+        # Precompute duplicate candidates against the existing library in
+        # parallel. This phase is read-only (safe across threads) and the
+        # fuzzy matcher releases the GIL, so it scales with cores; all
+        # mutations stay on the calling thread below.
+        prefound: List[Optional[str]] = [None] * len(papers)
+        if self.auto_deduplicate and len(papers) >= 32:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                prefound = list(executor.map(self._find_duplicate, papers))
+
+        # Defer storage writes until the whole batch is processed
+        with self.buffered():
+            for paper, existing_id in zip(papers, prefound):
+                if self.auto_deduplicate and existing_id in self.references:
+                    logger.debug(f"Duplicate found, merging with {existing_id}")
+                    self._merge_papers(existing_id, paper)
+                    self._persist_merge(existing_id)
+                    ref_ids.append(existing_id)
+                else:
+                    # add_reference re-checks, catching intra-batch duplicates
+                    ref_ids.append(self.add_reference(paper))
 
         logger.info(f"Added {len(ref_ids)} references")
         return ref_ids
 
+    @contextmanager
+    def buffered(self):
+        """
+        Context manager that defers storage writes.
+
+        Inside the block, `_save_to_storage` calls are suppressed; a single
+        save runs on exit if anything changed. Avoids rewriting the library
+        file once per paper during batch adds.
+
+        Example:
+            ```python
+            with manager.buffered():
+                for paper in papers:
+                    manager.add_reference(paper)
+            ```
+        """
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._dirty = False
+                if self.storage_path:
+                    self._save_to_storage()
+
     def get_reference(self, ref_id: str) -> Optional[PaperMetadata]:
         """
         Retrieve reference by ID.
@@ -139,6 +304,18 @@ class ReferenceManager:
         """
         return self.references.get(ref_id)
 
+    def get_citing_references(self, ref_id: str) -> List[str]:
+        """
+        Get IDs of references that cite the given reference.
+
+        Args:
+            ref_id: Reference identifier
+
+        Returns:
+            Sorted list of citing reference IDs
+        """
+        return sorted(self._reverse_citation_links.get(ref_id, set()))
+
     def search_references(
         self,
         query: str,
@@ -147,6 +324,12 @@ class ReferenceManager:
         """
         Search within reference collection.
 
+        Matching is substring-based. Whole-word queries are narrowed to
+        candidates via the inverted token index first; a query token with
+        no posting (e.g. the partial word "quant") disables the narrowing
+        and the whole collection is scanned, so partial-word queries
+        still match.
+
         Args:
             query: Search query
             fields: Fields to search in
@@ -165,7 +348,30 @@ class ReferenceManager:
         query_lower = query.lower()
         matches = []
 
-        for paper in self.references.values():
+        # Narrow to candidates via the inverted index, then post-filter
+        # with the exact substring check on the requested fields
+        qtokens = re.findall(r"\w+", query_lower)
+        candidate_ids: Optional[Set[str]] = None
+        if qtokens:
+            for token in qtokens:
+                ids = self._token_index.get(token)
+                if not ids:
+                    # No whole-token posting: the query token is likely a
+                    # word fragment the index can't narrow on. Fall back
+                    # to scanning everything so substring matches survive.
+                    candidate_ids = None
+                    break
+                candidate_ids = set(ids) if candidate_ids is None else candidate_ids & ids
+        if candidate_ids is not None:
+            candidates = [
+                self.references[ref_id]
+                for ref_id in candidate_ids
+                if ref_id in self.references
+            ]
+        else:
+            candidates = list(self.references.values())
+
+        for paper in candidates:
             # Check each field
             for field in fields:
                 if field == "title" and paper.title:
@@ -227,6 +433,8 @@ class ReferenceManager:
         for paper in unique_papers:
             ref_id = self._generate_ref_id(paper)
             self.references[ref_id] = paper
+        self._rebuild_indices()
+        self._rebuild_stats()
 
         # Save changes
         if self.storage_path:
@@ -278,19 +486,37 @@ class ReferenceManager:
         kept_paper = self.references[keep_id]
         discarded_paper = self.references[discard_id]
 
+        self._stats_remove(kept_paper)
+        self._stats_remove(discarded_paper)
+
         merged_paper = self.dedup_engine.merge_paper_metadata([kept_paper, discarded_paper])
+        self._stats_add(merged_paper)
 
         # Update references
         self.references[keep_id] = merged_paper
         del self.references[discard_id]
+        self._unindex_reference(discard_id, discarded_paper)
+        self._index_reference(keep_id, merged_paper)
 
-        # Update citation links
+        # Update citation links (outgoing edges of the discarded ref)
         if discard_id in self.citation_links:
+            discarded_links = self.citation_links.pop(discard_id)
             if keep_id in self.citation_links:
-                self.citation_links[keep_id].extend(self.citation_links[discard_id])
+                self.citation_links[keep_id] |= discarded_links
             else:
-                self.citation_links[keep_id] = self.citation_links[discard_id]
-            del self.citation_links[discard_id]
+                self.citation_links[keep_id] = discarded_links
+            for cited_id in discarded_links:
+                reverse = self._reverse_citation_links.setdefault(cited_id, set())
+                reverse.discard(discard_id)
+                reverse.add(keep_id)
+
+        # Remap incoming edges pointing at the discarded ref
+        for citing_id in self._reverse_citation_links.pop(discard_id, set()):
+            links = self.citation_links.get(citing_id)
+            if links:
+                links.discard(discard_id)
+                links.add(keep_id)
+            self._reverse_citation_links.setdefault(keep_id, set()).add(citing_id)
 
         # Save changes
         if self.storage_path:
@@ -346,78 +572,317 @@ class ReferenceManager:
             print(f"With DOI: {stats['doi_count']}")
             ```
         """
-        stats = {
+        return {
             "total_count": len(self.references),
-            "doi_count": sum(1 for p in self.references.values() if p.doi),
-            "arxiv_count": sum(1 for p in self.references.values() if p.arxiv_id),
-            "pubmed_count": sum(1 for p in self.references.values() if p.pubmed_id),
-            "year_distribution": {},
+            "doi_count": self._stats["doi_count"],
+            "arxiv_count": self._stats["arxiv_count"],
+            "pubmed_count": self._stats["pubmed_count"],
+            "year_distribution": dict(self._stats["year_distribution"]),
             "citation_links": len(self.citation_links)
         }
 
-        # Year distribution
-        for paper in self.references.values():
-            if paper.year:
-                stats["year_distribution"][paper.year] = stats["year_distribution"].get(paper.year, 0) + 1
-
-        return stats
-
     # Helper methods
 
     def _generate_ref_id(self, paper: PaperMetadata) -> str:
         """Generate unique reference ID."""
         # Use primary identifier if available
         if paper.doi:
-            return f"doi_{hashlib.md5(paper.doi.encode()).hexdigest()[:8]}"
+            return f"doi_{_short_hash(paper.doi)}"
         elif paper.arxiv_id:
-            return f"arxiv_{hashlib.md5(paper.arxiv_id.encode()).hexdigest()[:8]}"
+            return f"arxiv_{_short_hash(paper.arxiv_id)}"
         elif paper.pubmed_id:
-            return f"pubmed_{hashlib.md5(paper.pubmed_id.encode()).hexdigest()[:8]}"
+            return f"pubmed_{_short_hash(paper.pubmed_id)}"
         else:
             # Hash title
-            title_hash = hashlib.md5(paper.title.encode()).hexdigest()[:8]
-            return f"ref_{title_hash}"
+            return f"ref_{_short_hash(paper.title)}"
 
     def _find_duplicate(self, paper: PaperMetadata) -> Optional[str]:
         """Find if paper is a duplicate of existing reference."""
-        for ref_id, existing_paper in self.references.items():
-            if self.dedup_engine.is_duplicate(existing_paper, paper):
+        # O(1) exact identifier lookups
+        if paper.doi:
+            ref_id = self._doi_index.get(paper.doi)
+            if ref_id:
+                return ref_id
+        if paper.arxiv_id:
+            ref_id = self._arxiv_index.get(paper.arxiv_id)
+            if ref_id:
                 return ref_id
+        if paper.pubmed_id:
+            ref_id = self._pubmed_index.get(paper.pubmed_id)
+            if ref_id:
+                return ref_id
+
+        # Fall back to fuzzy title matching
+        if paper.title:
+            for ref_id, existing_paper in self.references.items():
+                # Distinct identifiers on both sides means distinct papers
+                # (exact matches were already caught by the indices above)
+                if paper.doi and existing_paper.doi:
+                    continue
+                if paper.arxiv_id and existing_paper.arxiv_id:
+                    continue
+                if paper.pubmed_id and existing_paper.pubmed_id:
+                    continue
+                if existing_paper.title and self.dedup_engine._title_similarity(
+                    paper.title, existing_paper.title
+                ) >= 0.9:
+                    return ref_id
+
         return None
 
+    def _tokenize_paper(self, paper: PaperMetadata) -> Set[str]:
+        """Extract lowercased search tokens from title/abstract/authors."""
+        tokens = set()
+        if paper.title:
+            tokens.update(re.findall(r"\w+", paper.title.lower()))
+        if paper.abstract:
+            tokens.update(re.findall(r"\w+", paper.abstract.lower()))
+        for author in paper.authors:
+            tokens.update(re.findall(r"\w+", author.name.lower()))
+        return tokens
+
+    def _index_reference(self, ref_id: str, paper: PaperMetadata):
+        """Register paper identifiers and tokens in the lookup indices."""
+        if paper.doi:
+            self._doi_index[paper.doi] = ref_id
+        if paper.arxiv_id:
+            self._arxiv_index[paper.arxiv_id] = ref_id
+        if paper.pubmed_id:
+            self._pubmed_index[paper.pubmed_id] = ref_id
+        for token in self._tokenize_paper(paper):
+            self._token_index.setdefault(token, set()).add(ref_id)
+
+    def _unindex_reference(self, ref_id: str, paper: PaperMetadata):
+        """Remove paper identifiers and tokens from the lookup indices."""
+        if paper.doi:
+            self._doi_index.pop(paper.doi, None)
+        if paper.arxiv_id:
+            self._arxiv_index.pop(paper.arxiv_id, None)
+        if paper.pubmed_id:
+            self._pubmed_index.pop(paper.pubmed_id, None)
+        for token in self._tokenize_paper(paper):
+            ids = self._token_index.get(token)
+            if ids:
+                ids.discard(ref_id)
+                if not ids:
+                    del self._token_index[token]
+
+    def _rebuild_indices(self):
+        """Rebuild identifier and token indices from the references dict."""
+        self._doi_index.clear()
+        self._arxiv_index.clear()
+        self._pubmed_index.clear()
+        self._token_index.clear()
+        for ref_id, paper in self.references.items():
+            self._index_reference(ref_id, paper)
+
     def _merge_papers(self, ref_id: str, new_paper: PaperMetadata):
         """Merge new paper data into existing reference."""
         existing_paper = self.references[ref_id]
+        self._stats_remove(existing_paper)
         merged_paper = self.dedup_engine.merge_paper_metadata([existing_paper, new_paper])
         self.references[ref_id] = merged_paper
+        self._index_reference(ref_id, merged_paper)
+        self._stats_add(merged_paper)
+
+    def _persist_merge(self, ref_id: str):
+        """
+        Persist a merge result.
+
+        JSONL storage only ever appends, so the merged record has to be
+        appended itself — the loader keeps the last record per ref_id. JSON
+        mode rewrites the whole file on the next save and needs nothing
+        here.
+        """
+        if self.storage_path and self._is_jsonl:
+            self._append_to_storage(ref_id, self.references[ref_id])
+
+    def _serialize_paper(self, paper: PaperMetadata) -> Dict[str, Any]:
+        """Serialize paper to a storage dict."""
+        return {
+            "id": paper.id,
+            "source": paper.source.value,
+            "title": paper.title,
+            "abstract": paper.abstract,
+            "authors": [{"name": a.name} for a in paper.authors],
+            "year": paper.year,
+            "doi": paper.doi,
+            "arxiv_id": paper.arxiv_id,
+            "pubmed_id": paper.pubmed_id,
+            "url": paper.url,
+            "journal": paper.journal,
+            "citation_count": paper.citation_count
+        }
+
+    def _deserialize_paper(self, paper_data: Dict[str, Any]) -> PaperMetadata:
+        """Reconstruct PaperMetadata from a storage dict."""
+        from kosmos.literature.base_client import PaperSource, Author
+
+        authors = [Author(name=a["name"]) for a in paper_data.get("authors", [])]
+
+        return PaperMetadata(
+            id=paper_data.get("id", ""),
+            source=PaperSource(paper_data.get("source", "other")),
+            title=paper_data.get("title", ""),
+            abstract=paper_data.get("abstract", ""),
+            authors=authors,
+            year=paper_data.get("year"),
+            doi=paper_data.get("doi"),
+            arxiv_id=paper_data.get("arxiv_id"),
+            pubmed_id=paper_data.get("pubmed_id"),
+            url=paper_data.get("url"),
+            journal=paper_data.get("journal"),
+            citation_count=paper_data.get("citation_count", 0)
+        )
+
+    def _stats_add(self, paper: PaperMetadata):
+        """Update running statistics for a newly stored paper."""
+        if paper.doi:
+            self._stats["doi_count"] += 1
+        if paper.arxiv_id:
+            self._stats["arxiv_count"] += 1
+        if paper.pubmed_id:
+            self._stats["pubmed_count"] += 1
+        if paper.year:
+            self._stats["year_distribution"][paper.year] += 1
+
+    def _stats_remove(self, paper: PaperMetadata):
+        """Update running statistics for a removed or replaced paper."""
+        if paper.doi:
+            self._stats["doi_count"] -= 1
+        if paper.arxiv_id:
+            self._stats["arxiv_count"] -= 1
+        if paper.pubmed_id:
+            self._stats["pubmed_count"] -= 1
+        if paper.year:
+            self._stats["year_distribution"][paper.year] -= 1
+            if self._stats["year_distribution"][paper.year] <= 0:
+                del self._stats["year_distribution"][paper.year]
+
+    def _rebuild_stats(self):
+        """Recompute running statistics from the references dict."""
+        self._stats = {
+            "doi_count": 0,
+            "arxiv_count": 0,
+            "pubmed_count": 0,
+            "year_distribution": Counter()
+        }
+        for paper in self.references.values():
+            self._stats_add(paper)
+
+    def _citation_links_to_json(self) -> Dict[str, List[str]]:
+        """Convert set-backed citation links to a JSON-serializable dict."""
+        return {citing: sorted(cited) for citing, cited in self.citation_links.items()}
+
+    def _set_citation_links(self, raw: Optional[Dict[str, List[str]]]):
+        """Restore citation links from storage and rebuild the reverse index."""
+        self.citation_links = {
+            citing: set(cited) for citing, cited in (raw or {}).items()
+        }
+        self._reverse_citation_links = {}
+        for citing, cited_set in self.citation_links.items():
+            for cited in cited_set:
+                self._reverse_citation_links.setdefault(cited, set()).add(citing)
+
+    def _serialize_soa(self) -> Dict[str, Any]:
+        """Serialize the library as struct-of-arrays (one list per field)."""
+        data = {
+            "format": "soa",
+            "ref_ids": [],
+            "ids": [],
+            "sources": [],
+            "titles": [],
+            "abstracts": [],
+            "authors": [],
+            "years": [],
+            "dois": [],
+            "arxiv_ids": [],
+            "pubmed_ids": [],
+            "urls": [],
+            "journals": [],
+            "citation_counts": []
+        }
+
+        for ref_id, paper in self.references.items():
+            data["ref_ids"].append(ref_id)
+            data["ids"].append(paper.id)
+            data["sources"].append(paper.source.value)
+            data["titles"].append(paper.title)
+            data["abstracts"].append(paper.abstract)
+            data["authors"].append([a.name for a in paper.authors])
+            data["years"].append(paper.year)
+            data["dois"].append(paper.doi)
+            data["arxiv_ids"].append(paper.arxiv_id)
+            data["pubmed_ids"].append(paper.pubmed_id)
+            data["urls"].append(paper.url)
+            data["journals"].append(paper.journal)
+            data["citation_counts"].append(paper.citation_count)
+
+        return data
+
+    def _load_soa(self, data: Dict[str, Any]):
+        """Load a struct-of-arrays library file into the references dict."""
+        from kosmos.literature.base_client import PaperSource, Author
+
+        for row, ref_id in enumerate(data.get("ref_ids", [])):
+            paper = PaperMetadata(
+                id=data["ids"][row] or "",
+                source=PaperSource(data["sources"][row] or "other"),
+                title=data["titles"][row] or "",
+                abstract=data["abstracts"][row] or "",
+                authors=[Author(name=n) for n in data["authors"][row]],
+                year=data["years"][row],
+                doi=data["dois"][row],
+                arxiv_id=data["arxiv_ids"][row],
+                pubmed_id=data["pubmed_ids"][row],
+                url=data["urls"][row],
+                journal=data["journals"][row],
+                citation_count=data["citation_counts"][row] or 0
+            )
+            self.references[ref_id] = paper
+            self._index_reference(ref_id, paper)
+            self._stats_add(paper)
+
+    def _append_to_storage(self, ref_id: str, paper: PaperMetadata):
+        """Append a single reference record to JSONL storage (O(1) I/O)."""
+        try:
+            record = {"ref_id": ref_id, **self._serialize_paper(paper)}
+            with open(self.storage_path, 'ab') as f:
+                f.write(_dumps_line(record))
+        except Exception as e:
+            logger.error(f"Failed to append to storage: {e}")
 
     def _save_to_storage(self):
-        """Save references to disk."""
+        """Save references to disk (atomic write via temp file)."""
+        if self._in_batch:
+            self._dirty = True
+            return
+
         try:
-            data = {
-                "references": {},
-                "citation_links": self.citation_links
-            }
+            # Write to a temp file and atomically replace to avoid
+            # corrupting the library if interrupted mid-write
+            tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
+
+            if self._is_jsonl:
+                # One record per line, citation links as a trailing record
+                with open(tmp_path, 'wb') as f:
+                    for ref_id, paper in self.references.items():
+                        record = {"ref_id": ref_id, **self._serialize_paper(paper)}
+                        f.write(_dumps_line(record))
+                    if self.citation_links:
+                        f.write(_dumps_line(
+                            {"citation_links": self._citation_links_to_json()}
+                        ))
+            else:
+                # Struct-of-arrays layout: one column per field instead of
+                # one dict per paper, avoiding per-record dict allocation
+                # and repeated key strings in the file
+                data = self._serialize_soa()
+                data["citation_links"] = self._citation_links_to_json()
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps_indented(data))
 
-            # Serialize papers
-            for ref_id, paper in self.references.items():
-                data["references"][ref_id] = {
-                    "id": paper.id,
-                    "source": paper.source.value,
-                    "title": paper.title,
-                    "abstract": paper.abstract,
-                    "authors": [{"name": a.name} for a in paper.authors],
-                    "year": paper.year,
-                    "doi": paper.doi,
-                    "arxiv_id": paper.arxiv_id,
-                    "pubmed_id": paper.pubmed_id,
-                    "url": paper.url,
-                    "journal": paper.journal,
-                    "citation_count": paper.citation_count
-                }
-
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.storage_path)
 
         except Exception as e:
             logger.error(f"Failed to save to storage: {e}")
@@ -425,33 +890,56 @@ class ReferenceManager:
     def _load_from_storage(self):
         """Load references from disk."""
         try:
-            with open(self.storage_path, 'r') as f:
-                data = json.load(f)
-
-            # Deserialize papers
-            from kosmos.literature.base_client import PaperSource, Author
-
-            for ref_id, paper_data in data.get("references", {}).items():
-                authors = [Author(name=a["name"]) for a in paper_data.get("authors", [])]
-
-                paper = PaperMetadata(
-                    id=paper_data.get("id", ""),
-                    source=PaperSource(paper_data.get("source", "other")),
-                    title=paper_data.get("title", ""),
-                    abstract=paper_data.get("abstract", ""),
-                    authors=authors,
-                    year=paper_data.get("year"),
-                    doi=paper_data.get("doi"),
-                    arxiv_id=paper_data.get("arxiv_id"),
-                    pubmed_id=paper_data.get("pubmed_id"),
-                    url=paper_data.get("url"),
-                    journal=paper_data.get("journal"),
-                    citation_count=paper_data.get("citation_count", 0)
-                )
-
-                self.references[ref_id] = paper
-
-            self.citation_links = data.get("citation_links", {})
+            if self._is_jsonl:
+                # Stream one record per line; later records win on ref_id
+                # collisions (appends after merges)
+                with open(self.storage_path, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        record = _loads(line)
+                        if "citation_links" in record:
+                            self._set_citation_links(record["citation_links"])
+                            continue
+                        ref_id = record.pop("ref_id")
+                        paper = self._deserialize_paper(record)
+                        if ref_id in self.references:
+                            self._stats_remove(self.references[ref_id])
+                        self.references[ref_id] = paper
+                        self._index_reference(ref_id, paper)
+                        self._stats_add(paper)
+            else:
+                with open(self.storage_path, 'rb') as f:
+                    # Legacy per-record files can be huge; stream them with
+                    # ijson instead of materializing the whole document
+                    head = f.read(256)
+                    f.seek(0)
+
+                    if IJSON_AVAILABLE and b'"references"' in head:
+                        for ref_id, paper_data in ijson.kvitems(f, "references"):
+                            paper = self._deserialize_paper(paper_data)
+                            self.references[ref_id] = paper
+                            self._index_reference(ref_id, paper)
+                            self._stats_add(paper)
+
+                        f.seek(0)
+                        for links in ijson.items(f, "citation_links"):
+                            self._set_citation_links(dict(links) if links else {})
+                    else:
+                        data = _loads(f.read())
+
+                        if data.get("format") == "soa":
+                            self._load_soa(data)
+                        else:
+                            # Legacy per-record layout, no ijson installed
+                            for ref_id, paper_data in data.get("references", {}).items():
+                                paper = self._deserialize_paper(paper_data)
+                                self.references[ref_id] = paper
+                                self._index_reference(ref_id, paper)
+                                self._stats_add(paper)
+
+                        self._set_citation_links(data.get("citation_links", {}))
 
             logger.info(f"Loaded {len(self.references)} references from storage")
 
@@ -476,27 +964,34 @@ class ReferenceManager:
             }
             data.append(paper_dict)
 
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_file, 'wb') as f:
+            f.write(_dumps_indented(data))
 
     def _export_csv(self, papers: List[PaperMetadata], output_file: str):
         """Export to CSV format."""
         import csv
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'authors', 'year', 'journal', 'doi', 'citation_count']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        fieldnames = ['title', 'authors', 'year', 'journal', 'doi', 'citation_count']
+
+        # Positional writer + row generator: writerows iterates in C and
+        # skips the per-field dict lookups DictWriter performs
+        rows = (
+            (
+                paper.title,
+                "; ".join(a.name for a in paper.authors),
+                paper.year or '',
+                paper.journal or '',
+                paper.doi or '',
+                paper.citation_count
+            )
+            for paper in papers
+        )
 
-            writer.writeheader()
-            for paper in papers:
-                writer.writerow({
-                    'title': paper.title,
-                    'authors': "; ".join([a.name for a in paper.authors]),
-                    'year': paper.year or '',
-                    'journal': paper.journal or '',
-                    'doi': paper.doi or '',
-                    'citation_count': paper.citation_count
-                })
+        with open(output_file, 'w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
 
 
 class DeduplicationEngine:
@@ -559,6 +1054,9 @@ class DeduplicationEngine:
         Returns:
             Tuple of (unique_papers, duplicate_groups)
         """
+        if RAPIDFUZZ_AVAILABLE and len(papers) > 1:
+            return self._deduplicate_by_title_vectorized(papers, threshold)
+
         unique_papers = []
         duplicate_groups = {}
         processed_titles = []
@@ -584,6 +1082,82 @@ class DeduplicationEngine:
 
         return unique_papers, duplicate_groups
 
+    def _group_titles_vectorized(self, titles: List[str], threshold: float):
+        """
+        Group near-duplicate titles using a single rapidfuzz score matrix.
+
+        Computes the full pairwise similarity matrix in C (SIMD, parallel
+        workers) and extracts duplicate groups via connected components,
+        replacing the O(N^2) Python comparison loop with one matrix call.
+
+        Args:
+            titles: List of titles to compare
+            threshold: Similarity threshold (0-1)
+
+        Returns:
+            Array of group labels; titles sharing a label are duplicates
+        """
+        normalized = [t.lower().strip() if t else "" for t in titles]
+
+        # Very large libraries: O(N) memory compiled kernel instead of
+        # materializing the full N x N score matrix
+        if NUMBA_KERNELS_AVAILABLE and len(normalized) > _NUMBA_DISPATCH_THRESHOLD:
+            codes, offsets = encode_titles(normalized)
+            first_match = pairwise_first_match(codes, offsets, threshold)
+
+            labels = np.arange(len(normalized), dtype=np.int64)
+            for i, j in enumerate(first_match):
+                if j >= 0:
+                    # Chase to the group root (earliest member)
+                    root = j
+                    while first_match[root] >= 0:
+                        root = first_match[root]
+                    labels[i] = root
+            return labels
+
+        scores = rf_process.cdist(
+            normalized,
+            normalized,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold * 100,
+            workers=-1,
+            dtype=np.uint8
+        )
+
+        adjacency = np.triu(scores, k=1) >= threshold * 100
+
+        # Empty titles are never duplicates of anything
+        empty = np.array([not t for t in normalized], dtype=bool)
+        if empty.any():
+            adjacency[empty, :] = False
+            adjacency[:, empty] = False
+
+        _, labels = connected_components(csr_matrix(adjacency), directed=False)
+        return labels
+
+    def _deduplicate_by_title_vectorized(
+        self,
+        papers: List[PaperMetadata],
+        threshold: float
+    ) -> Tuple[List[PaperMetadata], Dict[str, List[str]]]:
+        """Vectorized fuzzy title deduplication (rapidfuzz path)."""
+        titles = [paper.title or "" for paper in papers]
+        labels = self._group_titles_vectorized(titles, threshold)
+
+        unique_papers = []
+        duplicate_groups = {}
+        group_keys = {}  # label -> title of first (kept) paper
+
+        for paper, label in zip(papers, labels):
+            if label in group_keys:
+                duplicate_groups[group_keys[label]].append(paper.title)
+            else:
+                group_keys[label] = paper.title
+                unique_papers.append(paper)
+                duplicate_groups[paper.title] = [paper.title]
+
+        return unique_papers, duplicate_groups
+
     def comprehensive_deduplication(
         self,
         papers: List[PaperMetadata]
@@ -599,11 +1173,18 @@ class DeduplicationEngine:
         Returns:
             Tuple of (unique_papers, duplicate_groups)
         """
+        if RAPIDFUZZ_AVAILABLE and len(papers) > 1:
+            return self._comprehensive_deduplication_vectorized(papers)
+
         # Track seen identifiers
         seen_dois = set()
         seen_arxiv = set()
         seen_pubmed = set()
-        seen_titles = []
+
+        # Titles bucketed by length: ratio >= 0.9 requires the two lengths
+        # to be within ~10% of their mean, so only a narrow band of buckets
+        # needs scanning per candidate
+        seen_titles_by_len: Dict[int, List[str]] = {}
 
         unique_papers = []
         duplicate_groups = {}
@@ -627,12 +1208,16 @@ class DeduplicationEngine:
                 is_duplicate = True
                 group_key = f"PubMed:{paper.pubmed_id}"
 
-            # Check fuzzy title
+            # Check fuzzy title (only length-compatible buckets)
             elif paper.title:
-                for existing_title in seen_titles:
-                    if self._title_similarity(paper.title, existing_title) >= 0.9:
-                        is_duplicate = True
-                        group_key = f"Title:{existing_title}"
+                title_len = len(paper.title)
+                for length in range(int(title_len * 0.818), int(title_len * 1.222) + 1):
+                    for existing_title in seen_titles_by_len.get(length, ()):
+                        if self._title_similarity(paper.title, existing_title) >= 0.9:
+                            is_duplicate = True
+                            group_key = f"Title:{existing_title}"
+                            break
+                    if is_duplicate:
                         break
 
             if is_duplicate:
@@ -652,13 +1237,79 @@ class DeduplicationEngine:
                 if paper.pubmed_id:
                     seen_pubmed.add(paper.pubmed_id)
                 if paper.title:
-                    seen_titles.append(paper.title)
+                    seen_titles_by_len.setdefault(len(paper.title), []).append(paper.title)
 
                 # Initialize group
                 duplicate_groups[paper.title] = [paper.title]
 
         return unique_papers, duplicate_groups
 
+    def _comprehensive_deduplication_vectorized(
+        self,
+        papers: List[PaperMetadata]
+    ) -> Tuple[List[PaperMetadata], Dict[str, List[str]]]:
+        """
+        Vectorized multi-level deduplication (rapidfuzz path).
+
+        Identifier matching (DOI/arXiv/PubMed) stays a single O(N) set pass;
+        the fuzzy title stage runs as one score-matrix call over the
+        survivors instead of a nested Python loop.
+        """
+        seen_dois = set()
+        seen_arxiv = set()
+        seen_pubmed = set()
+
+        candidates = []
+        duplicate_groups = {}
+
+        # Pass 1: exact identifier matching
+        for paper in papers:
+            if paper.doi and paper.doi in seen_dois:
+                group_key = f"DOI:{paper.doi}"
+            elif paper.arxiv_id and paper.arxiv_id in seen_arxiv:
+                group_key = f"arXiv:{paper.arxiv_id}"
+            elif paper.pubmed_id and paper.pubmed_id in seen_pubmed:
+                group_key = f"PubMed:{paper.pubmed_id}"
+            else:
+                group_key = None
+
+            if group_key:
+                if group_key not in duplicate_groups:
+                    duplicate_groups[group_key] = []
+                duplicate_groups[group_key].append(paper.title)
+            else:
+                candidates.append(paper)
+                if paper.doi:
+                    seen_dois.add(paper.doi)
+                if paper.arxiv_id:
+                    seen_arxiv.add(paper.arxiv_id)
+                if paper.pubmed_id:
+                    seen_pubmed.add(paper.pubmed_id)
+
+        # Pass 2: fuzzy title matching over survivors, one matrix call
+        unique_papers = []
+        if len(candidates) > 1:
+            titles = [paper.title or "" for paper in candidates]
+            labels = self._group_titles_vectorized(titles, threshold=0.9)
+
+            group_keys = {}  # label -> title of first (kept) paper
+            for paper, label in zip(candidates, labels):
+                if label in group_keys:
+                    title_key = f"Title:{group_keys[label]}"
+                    if title_key not in duplicate_groups:
+                        duplicate_groups[title_key] = []
+                    duplicate_groups[title_key].append(paper.title)
+                else:
+                    group_keys[label] = paper.title
+                    unique_papers.append(paper)
+                    duplicate_groups[paper.title] = [paper.title]
+        else:
+            for paper in candidates:
+                unique_papers.append(paper)
+                duplicate_groups[paper.title] = [paper.title]
+
+        return unique_papers, duplicate_groups
+
     def merge_paper_metadata(
         self,
         papers: List[PaperMetadata]
@@ -733,16 +1384,16 @@ class DeduplicationEngine:
             True if duplicate, False otherwise
         """
         # Check DOI
-        if paper1.doi and paper2.doi and paper1.doi == paper2.doi:
-            return True
+        if paper1.doi and paper2.doi:
+            return paper1.doi == paper2.doi
 
         # Check arXiv
-        if paper1.arxiv_id and paper2.arxiv_id and paper1.arxiv_id == paper2.arxiv_id:
-            return True
+        if paper1.arxiv_id and paper2.arxiv_id:
+            return paper1.arxiv_id == paper2.arxiv_id
 
         # Check PubMed
-        if paper1.pubmed_id and paper2.pubmed_id and paper1.pubmed_id == paper2.pubmed_id:
-            return True
+        if paper1.pubmed_id and paper2.pubmed_id:
+            return paper1.pubmed_id == paper2.pubmed_id
 
         # Check fuzzy title
         if paper1.title and paper2.title:
@@ -760,8 +1411,17 @@ class DeduplicationEngine:
         t1 = title1.lower().strip()
         t2 = title2.lower().strip()
 
-        # Calculate similarity
-        return SequenceMatcher(None, t1, t2).ratio()
+        # Canonical ordering so (a, b) and (b, a) share a cache slot
+        if t1 > t2:
+            t1, t2 = t2, t1
+
+        return _similarity_cached(t1, t2)
+
+
+@functools.lru_cache(maxsize=65536)
+def _similarity_cached(t1: str, t2: str) -> float:
+    """Memoized SequenceMatcher ratio on normalized, ordered title pairs."""
+    return SequenceMatcher(None, t1, t2).ratio()
 
 
 # Singleton instance
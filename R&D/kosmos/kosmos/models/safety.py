@@ -5,9 +5,13 @@ Pydantic models for safety reports, incidents, approvals, and ethical guidelines
 """
 
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field
+import threading
+import time
+
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, model_validator
 
 
 class RiskLevel(str, Enum):
@@ -19,6 +23,11 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
+# Built once: has_critical_violations tests every violation against this set,
+# and the inline list literal allocated per element per call.
+_CRITICAL_LEVELS = frozenset((RiskLevel.CRITICAL, RiskLevel.HIGH))
+
+
 class ViolationType(str, Enum):
     """Types of safety violations."""
 
@@ -71,14 +80,30 @@ class SafetyReport(BaseModel):
 
     def has_critical_violations(self) -> bool:
         """Check if report has any critical or high-risk violations."""
-        return any(
-            v.severity in [RiskLevel.CRITICAL, RiskLevel.HIGH]
-            for v in self.violations
-        )
+        return any(v.severity in _CRITICAL_LEVELS for v in self.violations)
+
+    # Lazily built per-type index so repeated get_violations_by_type calls
+    # don't rescan the whole violations list; rebuilt if the list grew behind
+    # our back (callers may construct reports from pre-assembled lists).
+    _by_type: Optional[Dict[ViolationType, List[SafetyViolation]]] = PrivateAttr(default=None)
+    _by_type_size: int = PrivateAttr(default=0)
+
+    def add_violation(self, violation: SafetyViolation):
+        """Add a violation, keeping the per-type index in sync."""
+        self.violations.append(violation)
+        if self._by_type is not None:
+            self._by_type.setdefault(violation.type, []).append(violation)
+            self._by_type_size += 1
 
     def get_violations_by_type(self, violation_type: ViolationType) -> List[SafetyViolation]:
         """Get violations of a specific type."""
-        return [v for v in self.violations if v.type == violation_type]
+        if self._by_type is None or self._by_type_size != len(self.violations):
+            index: Dict[ViolationType, List[SafetyViolation]] = {}
+            for v in self.violations:
+                index.setdefault(v.type, []).append(v)
+            self._by_type = index
+            self._by_type_size = len(self.violations)
+        return self._by_type.get(violation_type, [])
 
     def summary(self) -> str:
         """Generate human-readable summary."""
@@ -145,13 +170,26 @@ class ApprovalRequest(BaseModel):
     timeout_seconds: int = 3600  # Auto-reject after 1 hour by default
     context: Dict[str, Any] = Field(default_factory=dict)
 
-    def is_expired(self) -> bool:
-        """Check if approval request has expired."""
-        if self.status != ApprovalStatus.PENDING:
-            return False
+    # Precomputed expiry deadline on the monotonic clock: is_expired is polled
+    # across all pending requests, and a single time.monotonic() comparison is
+    # cheaper than datetime arithmetic and immune to wall-clock jumps.
+    _deadline_monotonic: float = PrivateAttr(default=0.0)
 
+    @model_validator(mode="after")
+    def _set_deadline(self) -> "ApprovalRequest":
+        # Anchor to the stored timestamp, not validation time: rehydrated
+        # requests (model_dump round trips, persisted approvals) must keep
+        # their original expiry rather than gaining a fresh full timeout.
         elapsed = (datetime.now() - self.timestamp).total_seconds()
-        return elapsed > self.timeout_seconds
+        self._deadline_monotonic = time.monotonic() + self.timeout_seconds - elapsed
+        return self
+
+    def is_expired(self) -> bool:
+        """Check if approval request has expired."""
+        return (
+            self.status == ApprovalStatus.PENDING
+            and time.monotonic() >= self._deadline_monotonic
+        )
 
     def approve(self, approved_by: str):
         """Approve the request."""
@@ -175,7 +213,49 @@ class ApprovalRequest(BaseModel):
         frozen = False
 
 
-class ResourceLimit(BaseModel):
+# Cached TypeAdapters: pydantic resolves field validators through internal
+# dispatch on every Model(**data)/.dict() call, so the adapters are built once
+# per process and reused for all (de)serialization on the audit/alert path.
+_SAFETY_VIOLATION_ADAPTER = TypeAdapter(SafetyViolation)
+_SAFETY_REPORT_ADAPTER = TypeAdapter(SafetyReport)
+_SAFETY_INCIDENT_ADAPTER = TypeAdapter(SafetyIncident)
+_APPROVAL_REQUEST_ADAPTER = TypeAdapter(ApprovalRequest)
+
+
+def dump_report(report: SafetyReport) -> Dict[str, Any]:
+    """Serialize a SafetyReport via the cached adapter."""
+    return _SAFETY_REPORT_ADAPTER.dump_python(report)
+
+
+def load_report(data: Dict[str, Any]) -> SafetyReport:
+    """Deserialize a SafetyReport via the cached adapter."""
+    return _SAFETY_REPORT_ADAPTER.validate_python(data)
+
+
+def dump_incident(incident: SafetyIncident) -> Dict[str, Any]:
+    """Serialize a SafetyIncident via the cached adapter."""
+    return _SAFETY_INCIDENT_ADAPTER.dump_python(incident)
+
+
+def load_incident(data: Dict[str, Any]) -> SafetyIncident:
+    """Deserialize a SafetyIncident via the cached adapter."""
+    return _SAFETY_INCIDENT_ADAPTER.validate_python(data)
+
+
+def dump_approval_request(request: ApprovalRequest) -> Dict[str, Any]:
+    """Serialize an ApprovalRequest via the cached adapter."""
+    return _APPROVAL_REQUEST_ADAPTER.dump_python(request)
+
+
+def load_approval_request(data: Dict[str, Any]) -> ApprovalRequest:
+    """Deserialize an ApprovalRequest via the cached adapter."""
+    return _APPROVAL_REQUEST_ADAPTER.validate_python(data)
+
+
+# Internal-only types (never cross an API boundary): plain dataclasses with
+# __slots__ skip pydantic-core validation on construction
+@dataclass(slots=True)
+class ResourceLimit:
     """Resource consumption limits for experiments."""
 
     max_cpu_cores: Optional[float] = None
@@ -187,22 +267,28 @@ class ResourceLimit(BaseModel):
     allow_file_write: bool = False
     allow_subprocess: bool = False
 
-    class Config:
-        frozen = False
-
 
-class EmergencyStopStatus(BaseModel):
+@dataclass(slots=True)
+class EmergencyStopStatus:
     """Status of emergency stop mechanism."""
 
-    is_active: bool = False
     triggered_at: Optional[datetime] = None
     triggered_by: Optional[str] = None  # "signal", "flag_file", "api", "user"
     reason: Optional[str] = None
-    affected_experiments: List[str] = Field(default_factory=list)
+    affected_experiments: List[str] = field(default_factory=list)
+    # The flag itself lives in a threading.Event so the is_active poll on
+    # every experiment execution path is a single lock-free read; the audit
+    # fields above are only written on trigger/reset.
+    _event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the emergency stop flag is set."""
+        return self._event.is_set()
 
     def trigger(self, triggered_by: str, reason: str, affected_experiments: List[str] = None):
         """Trigger emergency stop."""
-        self.is_active = True
+        self._event.set()
         self.triggered_at = datetime.now()
         self.triggered_by = triggered_by
         self.reason = reason
@@ -211,11 +297,8 @@ class EmergencyStopStatus(BaseModel):
 
     def reset(self):
         """Reset emergency stop."""
-        self.is_active = False
+        self._event.clear()
         self.triggered_at = None
         self.triggered_by = None
         self.reason = None
         self.affected_experiments = []
-
-    class Config:
-        frozen = False
@@ -7,14 +7,88 @@ Provides alert definitions and notification handlers for critical events.
 import logging
 import os
 import json
+import queue
+import sys
+import threading
 import time
-from typing import Dict, Any, List, Optional, Callable
+import weakref
+from typing import Dict, Any, Deque, List, Optional, Callable
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
+from functools import partial
+from itertools import islice
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for fast JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.debug(
+        "orjson not installed. Alert serialization will use the stdlib json "
+        "module. Install with: pip install orjson"
+    )
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to indented JSON, preferring orjson's native fast path."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+# Try to import numpy for vectorized threshold-rule evaluation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional psutil, resolved once at import: the resource checkers run every
+# tick and a None sentinel is cheaper than re-entering the import machinery.
+try:
+    import psutil as _psutil
+except ImportError:
+    _psutil = None
+
+# Health checker cached on first use so the condition checkers don't repeat
+# the kosmos.api.health import (and singleton lookup) per evaluation.
+_health_checker = None
+
+
+def _get_health_checker_cached():
+    """Get and cache the global health checker instance."""
+    global _health_checker
+    if _health_checker is None:
+        from kosmos.api.health import get_health_checker
+        _health_checker = get_health_checker()
+    return _health_checker
+
+
+# Short-lived memo for expensive condition probes (health checker, psutil).
+# Several rules transitively hit the same backend each evaluation tick; one
+# probe per tick window is enough since results are stable within a tick.
+_PROBE_TTL_SECONDS = 5.0
+_probe_cache: Dict[str, tuple] = {}
+
+
+def _cached_probe(key: str, probe: Callable[[], Any], ttl: float = _PROBE_TTL_SECONDS) -> Any:
+    """Return probe() result, reusing a cached value younger than ttl."""
+    now = time.monotonic()
+    entry = _probe_cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    result = probe()
+    _probe_cache[key] = (now, result)
+    return result
+
 
 class AlertSeverity(str, Enum):
     """Alert severity levels."""
@@ -43,23 +117,53 @@ class Alert:
     details: Dict[str, Any] = field(default_factory=dict)
     alert_id: Optional[str] = None
 
+    # Precomputed string forms of immutable fields: to_dict runs over every
+    # record on each API poll, and enum access plus ISO formatting add up.
+    _severity_str: str = field(init=False, repr=False, default="")
+    _timestamp_iso: str = field(init=False, repr=False, default="")
+    _ts_epoch: int = field(init=False, repr=False, default=0)
+    # Lazily cached serializations shared by all notification handlers
+    _cached_json_bytes: Optional[bytes] = field(init=False, repr=False, default=None)
+    _details_json: Optional[str] = field(init=False, repr=False, default=None)
+
     def __post_init__(self):
-        """Generate alert ID after initialization."""
+        """Generate alert ID and cache immutable field strings."""
+        # Interned names share storage and a cached hash across the many
+        # alerts a rule emits, speeding the active_alerts dict operations.
+        self.name = sys.intern(self.name)
+        self._severity_str = self.severity.value
+        self._timestamp_iso = self.timestamp.isoformat()
+        self._ts_epoch = int(self.timestamp.timestamp())
         if not self.alert_id:
-            self.alert_id = f"{self.name}_{int(self.timestamp.timestamp())}"
+            self.alert_id = f"{self.name}_{self._ts_epoch}"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary."""
         return {
             "alert_id": self.alert_id,
             "name": self.name,
-            "severity": self.severity.value,
+            "severity": self._severity_str,
             "message": self.message,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._timestamp_iso,
+            # status mutates (resolve/acknowledge), so it stays dynamic
             "status": self.status.value,
             "details": self.details
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the full alert payload once and reuse it across handlers.
+        """
+        if self._cached_json_bytes is None:
+            self._cached_json_bytes = _dumps_indented(self.to_dict()).encode()
+        return self._cached_json_bytes
+
+    def details_json(self) -> str:
+        """Indented JSON form of details, serialized once per alert."""
+        if self._details_json is None:
+            self._details_json = _dumps_indented(self.details)
+        return self._details_json
+
 
 @dataclass
 class AlertRule:
@@ -70,7 +174,18 @@ class AlertRule:
     severity: AlertSeverity
     message_template: str
     cooldown_seconds: int = 300  # 5 minutes default cooldown
-    last_triggered: Optional[datetime] = None
+    # Monotonic timestamp of the last trigger: cooldown checks run for every
+    # rule on every evaluation tick, and time.monotonic() comparison avoids
+    # per-check datetime/timedelta allocation and wall-clock jumps.
+    last_triggered_monotonic: float = float("-inf")
+
+    def __post_init__(self):
+        """Intern the rule name so every emitted alert shares one string."""
+        self.name = sys.intern(self.name)
+
+    def in_cooldown(self) -> bool:
+        """Check whether the rule is still within its cooldown window."""
+        return time.monotonic() - self.last_triggered_monotonic < self.cooldown_seconds
 
     def should_trigger(self) -> bool:
         """
@@ -80,10 +195,8 @@ class AlertRule:
             True if alert should trigger
         """
         # Check cooldown
-        if self.last_triggered:
-            cooldown_end = self.last_triggered + timedelta(seconds=self.cooldown_seconds)
-            if datetime.utcnow() < cooldown_end:
-                return False
+        if self.in_cooldown():
+            return False
 
         # Check condition
         try:
@@ -102,7 +215,8 @@ class AlertRule:
         Returns:
             Alert instance
         """
-        self.last_triggered = datetime.utcnow()
+        # The emitted Alert still carries a wall-clock timestamp for display.
+        self.last_triggered_monotonic = time.monotonic()
         return Alert(
             name=self.name,
             severity=self.severity,
@@ -125,86 +239,136 @@ class AlertManager:
     def __init__(self):
         """Initialize alert manager."""
         self.alert_rules: List[AlertRule] = []
+        # Rules that are simple "metric > threshold" checks, kept in parallel
+        # arrays so one vectorized comparison per tick covers all of them.
+        self._threshold_rules: List[AlertRule] = []
+        self._threshold_getters: List[Callable[[], Optional[float]]] = []
+        self._thresholds: List[float] = []
+        self._threshold_array = None  # numpy mirror of _thresholds
         self.active_alerts: Dict[str, Alert] = {}
-        self.alert_history: List[Alert] = []
+        # deque(maxlen=...) evicts in O(1); the old list-slice trim copied the
+        # full history on every overflow.
+        self.alert_history: Deque[Alert] = deque(maxlen=1000)
         self.notification_handlers: List[Callable[[Alert], None]] = []
 
+        # Resource usage sampled on a coarse cadence by a daemon thread so
+        # the per-tick checkers read cached floats instead of issuing a
+        # statvfs/sysinfo syscall per rule evaluation.
+        self._mem_percent: Optional[float] = None
+        self._disk_percent: Optional[float] = None
+        self._sampler_stop = threading.Event()
+        self._start_resource_sampler()
+
         # Initialize default alert rules
         self._initialize_default_rules()
 
         logger.info("Alert manager initialized")
 
+    RESOURCE_SAMPLE_INTERVAL_SECONDS = 5.0
+
+    def _sample_resources(self):
+        """Refresh cached memory and disk usage percentages."""
+        if _psutil is None:
+            # Cheap short-circuit: no exception machinery on the common
+            # "not installed" path
+            return
+        try:
+            self._mem_percent = _psutil.virtual_memory().percent
+            self._disk_percent = _psutil.disk_usage('/').percent
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Resource sampling failed: {e}")
+
+    def _start_resource_sampler(self):
+        """Start the daemon thread that periodically samples resource usage.
+
+        The loop holds the manager through a weakref and is gated on a
+        per-instance stop event, so transient managers can be garbage
+        collected (the thread then exits on its next wakeup) and close()
+        stops the thread deterministically.
+        """
+        stop = self._sampler_stop
+        manager_ref = weakref.ref(self)
+
+        def _loop():
+            while True:
+                manager = manager_ref()
+                if manager is None:
+                    return
+                manager._sample_resources()
+                del manager
+                if stop.wait(AlertManager.RESOURCE_SAMPLE_INTERVAL_SECONDS):
+                    return
+
+        self._sampler_thread = threading.Thread(
+            target=_loop, name="alert-resource-sampler", daemon=True
+        )
+        self._sampler_thread.start()
+
+    def close(self):
+        """Stop the resource sampler thread.
+
+        Idempotent; the last sampled values remain readable afterwards.
+        """
+        self._sampler_stop.set()
+
     def _initialize_default_rules(self):
-        """Initialize default alert rules."""
-
-        # Database connection failure
-        self.alert_rules.append(AlertRule(
-            name="database_connection_failed",
-            condition=self._check_database_connection,
-            severity=AlertSeverity.CRITICAL,
-            message_template="Database connection failed",
-            cooldown_seconds=60
-        ))
-
-        # High API failure rate
-        self.alert_rules.append(AlertRule(
-            name="high_api_failure_rate",
-            condition=self._check_api_failure_rate,
-            severity=AlertSeverity.ERROR,
-            message_template="High API failure rate detected",
-            cooldown_seconds=300
-        ))
-
-        # API rate limit approaching
-        self.alert_rules.append(AlertRule(
-            name="api_rate_limit_warning",
-            condition=self._check_api_rate_limit,
-            severity=AlertSeverity.WARNING,
-            message_template="Approaching API rate limit",
-            cooldown_seconds=600
-        ))
-
-        # High memory usage
-        self.alert_rules.append(AlertRule(
-            name="high_memory_usage",
-            condition=self._check_memory_usage,
-            severity=AlertSeverity.WARNING,
-            message_template="High memory usage detected",
-            cooldown_seconds=300
-        ))
-
-        # High disk usage
-        self.alert_rules.append(AlertRule(
-            name="high_disk_usage",
-            condition=self._check_disk_usage,
-            severity=AlertSeverity.WARNING,
-            message_template="High disk usage detected",
-            cooldown_seconds=600
-        ))
-
-        # Experiment failure rate
-        self.alert_rules.append(AlertRule(
-            name="high_experiment_failure_rate",
-            condition=self._check_experiment_failure_rate,
-            severity=AlertSeverity.ERROR,
-            message_template="High experiment failure rate",
-            cooldown_seconds=300
-        ))
-
-        # Cache unavailable
-        self.alert_rules.append(AlertRule(
-            name="cache_unavailable",
-            condition=self._check_cache_availability,
-            severity=AlertSeverity.WARNING,
-            message_template="Cache service unavailable",
-            cooldown_seconds=120
-        ))
+        """Initialize default alert rules from the module-level specs."""
+        self.alert_rules = [
+            AlertRule(
+                name=name,
+                condition=condition.__get__(self),
+                severity=severity,
+                message_template=template,
+                cooldown_seconds=cooldown
+            )
+            for name, condition, severity, template, cooldown
+            in _DEFAULT_RULE_SPECS
+        ]
+
+        for name, condition, severity, template, cooldown, attr, threshold \
+                in _DEFAULT_THRESHOLD_RULE_SPECS:
+            self.add_threshold_rule(
+                AlertRule(
+                    name=name,
+                    condition=condition.__get__(self),
+                    severity=severity,
+                    message_template=template,
+                    cooldown_seconds=cooldown
+                ),
+                value_getter=partial(getattr, self, attr),
+                threshold=threshold
+            )
 
     def add_alert_rule(self, rule: AlertRule):
         """Add a custom alert rule."""
         self.alert_rules.append(rule)
         logger.info(f"Added alert rule: {rule.name}")
 
+    def add_threshold_rule(
+        self,
+        rule: AlertRule,
+        value_getter: Callable[[], Optional[float]],
+        threshold: float
+    ):
+        """
+        Add a rule that fires when a sampled metric exceeds a threshold.
+
+        Threshold rules bypass the per-rule condition callable and are
+        evaluated together as one vectorized comparison per tick.
+
+        Args:
+            rule: Rule metadata (name, severity, cooldown); its condition
+                callable is kept only as a fallback
+            value_getter: Returns the current metric value, or None if unknown
+            threshold: Fire when value > threshold
+        """
+        self._threshold_rules.append(rule)
+        self._threshold_getters.append(value_getter)
+        self._thresholds.append(threshold)
+        if NUMPY_AVAILABLE:
+            self._threshold_array = np.array(self._thresholds, dtype=np.float32)
+        logger.info(f"Added threshold rule: {rule.name} (> {threshold})")
+
     def add_notification_handler(self, handler: Callable[[Alert], None]):
         """
         Add a notification handler.
@@ -222,6 +386,36 @@ class AlertManager:
                 alert = rule.trigger()
                 self._handle_alert(alert)
 
+        self._evaluate_threshold_rules()
+
+    def _evaluate_threshold_rules(self):
+        """Evaluate all threshold rules in one vectorized comparison."""
+        if not self._threshold_rules:
+            return
+
+        values = [getter() for getter in self._threshold_getters]
+
+        if NUMPY_AVAILABLE:
+            current = np.array(
+                [v if v is not None else float("-inf") for v in values],
+                dtype=np.float32
+            )
+            fired_indices = np.flatnonzero(current > self._threshold_array)
+        else:
+            fired_indices = [
+                i for i, v in enumerate(values)
+                if v is not None and v > self._thresholds[i]
+            ]
+
+        for i in fired_indices:
+            rule = self._threshold_rules[i]
+            if not rule.in_cooldown():
+                alert = rule.trigger(details={
+                    "value": values[i],
+                    "threshold": self._thresholds[i]
+                })
+                self._handle_alert(alert)
+
     def _handle_alert(self, alert: Alert):
         """
         Handle a triggered alert.
@@ -233,10 +427,6 @@ class AlertManager:
         self.active_alerts[alert.alert_id] = alert
         self.alert_history.append(alert)
 
-        # Trim history if too long
-        if len(self.alert_history) > 1000:
-            self.alert_history = self.alert_history[-1000:]
-
         logger.warning(f"Alert triggered: {alert.name} - {alert.message}")
 
         # Send notifications
@@ -267,17 +457,20 @@ class AlertManager:
 
     def get_alert_history(self, limit: int = 100) -> List[Alert]:
         """Get alert history."""
-        return self.alert_history[-limit:]
+        size = len(self.alert_history)
+        return list(islice(self.alert_history, max(0, size - limit), size))
 
     # Alert condition checkers
     def _check_database_connection(self) -> bool:
         """Check if database connection is failing."""
         try:
-            from kosmos.api.health import get_health_checker
-            health_checker = get_health_checker()
-            db_status = health_checker._check_database()
+            db_status = _cached_probe(
+                "health_database",
+                lambda: _get_health_checker_cached()._check_database()
+            )
             return db_status["status"] != "healthy"
-        except:
+        except (ImportError, AttributeError, OSError, KeyError, RuntimeError) as e:
+            logger.debug(f"Database health probe unavailable: {e}")
             return False
 
     def _check_api_failure_rate(self) -> bool:
@@ -294,23 +487,19 @@ class AlertManager:
 
     def _check_memory_usage(self) -> bool:
         """Check if memory usage is high."""
-        try:
-            import psutil
-            memory = psutil.virtual_memory()
-            # Alert if memory usage > 85%
-            return memory.percent > 85
-        except:
-            return False
+        if self._mem_percent is None:
+            # Cold start: the sampler may not have run yet
+            self._sample_resources()
+        # Alert if memory usage > 85%
+        return self._mem_percent is not None and self._mem_percent > 85
 
     def _check_disk_usage(self) -> bool:
         """Check if disk usage is high."""
-        try:
-            import psutil
-            disk = psutil.disk_usage('/')
-            # Alert if disk usage > 90%
-            return disk.percent > 90
-        except:
-            return False
+        if self._disk_percent is None:
+            # Cold start: the sampler may not have run yet
+            self._sample_resources()
+        # Alert if disk usage > 90%
+        return self._disk_percent is not None and self._disk_percent > 90
 
     def _check_experiment_failure_rate(self) -> bool:
         """Check if experiment failure rate is high."""
@@ -321,25 +510,176 @@ class AlertManager:
     def _check_cache_availability(self) -> bool:
         """Check if cache is unavailable."""
         try:
-            from kosmos.api.health import get_health_checker
-            health_checker = get_health_checker()
-            cache_status = health_checker._check_cache()
+            cache_status = _cached_probe(
+                "health_cache",
+                lambda: _get_health_checker_cached()._check_cache()
+            )
             return cache_status["status"] == "unhealthy"
-        except:
+        except (ImportError, AttributeError, OSError, KeyError, RuntimeError) as e:
+            logger.debug(f"Cache health probe unavailable: {e}")
             return False
 
 
+# Built-in rule specs, defined once at module load so each AlertManager
+# materializes its rules in a single pass instead of seven append calls.
+# Conditions are unbound methods, bound per instance via __get__.
+_DEFAULT_RULE_SPECS = (
+    ("database_connection_failed", AlertManager._check_database_connection,
+     AlertSeverity.CRITICAL, "Database connection failed", 60),
+    ("high_api_failure_rate", AlertManager._check_api_failure_rate,
+     AlertSeverity.ERROR, "High API failure rate detected", 300),
+    ("api_rate_limit_warning", AlertManager._check_api_rate_limit,
+     AlertSeverity.WARNING, "Approaching API rate limit", 600),
+    ("high_experiment_failure_rate", AlertManager._check_experiment_failure_rate,
+     AlertSeverity.ERROR, "High experiment failure rate", 300),
+    ("cache_unavailable", AlertManager._check_cache_availability,
+     AlertSeverity.WARNING, "Cache service unavailable", 120),
+)
+
+# Threshold rules: (..., sampled attribute, threshold); fire when value >
+# threshold via the vectorized pass in _evaluate_threshold_rules.
+_DEFAULT_THRESHOLD_RULE_SPECS = (
+    ("high_memory_usage", AlertManager._check_memory_usage,
+     AlertSeverity.WARNING, "High memory usage detected", 300,
+     "_mem_percent", 85.0),
+    ("high_disk_usage", AlertManager._check_disk_usage,
+     AlertSeverity.WARNING, "High disk usage detected", 600,
+     "_disk_percent", 90.0),
+)
+
+
+# Shared keep-alive HTTP session for remote notification handlers, created
+# lazily so importing this module never pulls in requests. Reusing one
+# pooled session avoids a TCP+TLS handshake per outgoing request.
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Get or create the shared pooled requests.Session."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
+class _BatchingNotifier:
+    """
+    Background worker that batches remote notifications.
+
+    Per-alert synchronous HTTP round-trips cap notification throughput at the
+    network latency; draining a queue into multi-alert requests keeps the
+    first alert's latency unchanged while letting storms coalesce into large
+    batches over a single keep-alive connection.
+    """
+
+    # Emit a meta-warning each time this many alerts have been shed, mirroring
+    # the dropped-event counters that audit subsystems keep under overload.
+    DROP_WARN_EVERY = 100
+
+    def __init__(self, name: str, send_batch: Callable[[List[Alert]], None]):
+        self.name = name
+        self._send_batch = send_batch
+        self.batch_size = int(os.getenv("ALERT_BATCH_SIZE", "100"))
+        self.flush_interval = int(os.getenv("ALERT_BATCH_INTERVAL_MS", "200")) / 1000.0
+        # Bounded queue: an unbounded one would grow without limit whenever
+        # producers outpace the network during an alert storm.
+        self._queue: "queue.Queue[Alert]" = queue.Queue(
+            maxsize=int(os.getenv("ALERT_QUEUE_MAX", "10000"))
+        )
+        self.dropped_alerts = 0
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, alert: Alert):
+        """
+        Enqueue an alert for delivery by the background worker.
+
+        When the queue is full, INFO/WARNING alerts are shed immediately;
+        ERROR/CRITICAL producers block briefly before giving up, trading a
+        little latency for delivery of the alerts that matter most.
+        """
+        self._ensure_worker()
+        try:
+            if alert.severity in (AlertSeverity.ERROR, AlertSeverity.CRITICAL):
+                self._queue.put(alert, timeout=0.05)
+            else:
+                self._queue.put_nowait(alert)
+        except queue.Full:
+            self.dropped_alerts += 1
+            if self.dropped_alerts % self.DROP_WARN_EVERY == 0:
+                logger.critical(
+                    f"{self.name} notification queue saturated: "
+                    f"{self.dropped_alerts} alerts dropped so far"
+                )
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(
+                        target=self._run,
+                        name=f"alert-batch-{self.name}",
+                        daemon=True
+                    )
+                    self._worker.start()
+
+    def _run(self):
+        while True:
+            # Block until there is work; the first alert is sent immediately.
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._send_batch(batch)
+            except Exception as e:
+                logger.error(f"Batched {self.name} notification failed: {e}")
+
+            # Under sustained load, pause briefly so the next batch fills up
+            # instead of degenerating back into one request per alert.
+            if not self._queue.empty():
+                time.sleep(self.flush_interval)
+
+
+# Severity dispatch tables built once at module load: the handlers run per
+# alert, and rebuilding a dict per call costs allocation plus hash lookups.
+_SEVERITY_LOGFUNC = {
+    AlertSeverity.INFO: logger.info,
+    AlertSeverity.WARNING: logger.warning,
+    AlertSeverity.ERROR: logger.error,
+    AlertSeverity.CRITICAL: logger.critical
+}
+
+_SEVERITY_COLOR = {
+    AlertSeverity.INFO: "#36a64f",
+    AlertSeverity.WARNING: "#ff9900",
+    AlertSeverity.ERROR: "#ff0000",
+    AlertSeverity.CRITICAL: "#8b0000"
+}
+
+# Severities that page a human; frozenset membership avoids allocating a
+# fresh list on every alert passing through the PagerDuty handler.
+_PAGERDUTY_SEVERITIES = frozenset((AlertSeverity.ERROR, AlertSeverity.CRITICAL))
+
+
 # Notification handlers
 def log_notification_handler(alert: Alert):
     """Log alert to logger (always enabled)."""
-    log_func = {
-        AlertSeverity.INFO: logger.info,
-        AlertSeverity.WARNING: logger.warning,
-        AlertSeverity.ERROR: logger.error,
-        AlertSeverity.CRITICAL: logger.critical
-    }.get(alert.severity, logger.info)
+    log_func = _SEVERITY_LOGFUNC.get(alert.severity, logger.info)
 
-    log_func(f"ALERT [{alert.severity.value.upper()}]: {alert.message} | {alert.details}")
+    log_func(f"ALERT [{alert._severity_str.upper()}]: {alert.message} | {alert.details}")
 
 
 def email_notification_handler(alert: Alert):
@@ -376,7 +716,7 @@ Message: {alert.message}
 Timestamp: {alert.timestamp.isoformat()}
 
 Details:
-{json.dumps(alert.details, indent=2)}
+{alert.details_json()}
 
 Alert ID: {alert.alert_id}
 """
@@ -400,121 +740,135 @@ Alert ID: {alert.alert_id}
         logger.error(f"Failed to send email notification: {e}")
 
 
+def _slack_attachment(alert: Alert) -> Dict[str, Any]:
+    """Build the Slack attachment payload for a single alert."""
+    # Color coding by severity
+    color = _SEVERITY_COLOR.get(alert.severity, "#808080")
+
+    attachment = {
+        "color": color,
+        "title": f"{alert._severity_str.upper()}: {alert.name}",
+        "text": alert.message,
+        "fields": [
+            {
+                "title": "Timestamp",
+                "value": alert._timestamp_iso,
+                "short": True
+            },
+            {
+                "title": "Alert ID",
+                "value": alert.alert_id,
+                "short": True
+            }
+        ],
+        "footer": "Kosmos Alert System",
+        "ts": alert._ts_epoch
+    }
+
+    # Add details if present
+    if alert.details:
+        attachment["fields"].append({
+            "title": "Details",
+            "value": f"```{alert.details_json()}```",
+            "short": False
+        })
+
+    return attachment
+
+
+def _send_slack_batch(alerts: List[Alert]):
+    """Send a batch of alerts as one multi-attachment Slack message."""
+    webhook_url = os.getenv("SLACK_WEBHOOK_URL")
+    if not webhook_url:
+        logger.warning("SLACK_WEBHOOK_URL not configured")
+        return
+
+    payload = {"attachments": [_slack_attachment(alert) for alert in alerts]}
+
+    response = _get_http_session().post(webhook_url, json=payload, timeout=10)
+    response.raise_for_status()
+
+    logger.info(f"Slack notification sent for {len(alerts)} alert(s)")
+
+
+_slack_notifier = _BatchingNotifier("slack", _send_slack_batch)
+
+
 def slack_notification_handler(alert: Alert):
     """
     Send Slack notification (requires configuration).
 
+    Alerts are enqueued and delivered in batches by a background worker.
+
     Environment variables:
     - ALERT_SLACK_ENABLED: true/false
     - SLACK_WEBHOOK_URL: Slack webhook URL
+    - ALERT_BATCH_SIZE: max alerts per outgoing request (default 100)
+    - ALERT_BATCH_INTERVAL_MS: pause between flushes under load (default 200)
     """
     if not os.getenv("ALERT_SLACK_ENABLED", "false").lower() == "true":
         return
 
-    try:
-        import requests
+    _slack_notifier.submit(alert)
 
-        webhook_url = os.getenv("SLACK_WEBHOOK_URL")
-        if not webhook_url:
-            logger.warning("SLACK_WEBHOOK_URL not configured")
-            return
 
-        # Color coding by severity
-        color = {
-            AlertSeverity.INFO: "#36a64f",
-            AlertSeverity.WARNING: "#ff9900",
-            AlertSeverity.ERROR: "#ff0000",
-            AlertSeverity.CRITICAL: "#8b0000"
-        }.get(alert.severity, "#808080")
+def _send_pagerduty_batch(alerts: List[Alert]):
+    """Send a batch of alerts as PagerDuty events over the shared session."""
+    integration_key = os.getenv("PAGERDUTY_INTEGRATION_KEY")
+    if not integration_key:
+        logger.warning("PAGERDUTY_INTEGRATION_KEY not configured")
+        return
 
+    # The Events API accepts one event per request; the pooled session keeps
+    # the TLS connection open across the batch instead of handshaking per alert.
+    session = _get_http_session()
+    for alert in alerts:
         payload = {
-            "attachments": [
-                {
-                    "color": color,
-                    "title": f"{alert.severity.value.upper()}: {alert.name}",
-                    "text": alert.message,
-                    "fields": [
-                        {
-                            "title": "Timestamp",
-                            "value": alert.timestamp.isoformat(),
-                            "short": True
-                        },
-                        {
-                            "title": "Alert ID",
-                            "value": alert.alert_id,
-                            "short": True
-                        }
-                    ],
-                    "footer": "Kosmos Alert System",
-                    "ts": int(alert.timestamp.timestamp())
-                }
-            ]
+            "routing_key": integration_key,
+            "event_action": "trigger",
+            "dedup_key": alert.alert_id,
+            "payload": {
+                "summary": f"{alert._severity_str.upper()}: {alert.message}",
+                "severity": alert._severity_str,
+                "source": "kosmos-ai-scientist",
+                "timestamp": alert._timestamp_iso,
+                "custom_details": alert.details
+            }
         }
 
-        # Add details if present
-        if alert.details:
-            payload["attachments"][0]["fields"].append({
-                "title": "Details",
-                "value": f"```{json.dumps(alert.details, indent=2)}```",
-                "short": False
-            })
-
-        response = requests.post(webhook_url, json=payload, timeout=10)
+        response = session.post(
+            "https://events.pagerduty.com/v2/enqueue",
+            json=payload,
+            timeout=10
+        )
         response.raise_for_status()
 
-        logger.info(f"Slack notification sent for alert: {alert.name}")
+    logger.info(f"PagerDuty notification sent for {len(alerts)} alert(s)")
 
-    except Exception as e:
-        logger.error(f"Failed to send Slack notification: {e}")
+
+_pagerduty_notifier = _BatchingNotifier("pagerduty", _send_pagerduty_batch)
 
 
 def pagerduty_notification_handler(alert: Alert):
     """
     Send PagerDuty notification (requires configuration).
 
+    Alerts are enqueued and delivered in batches by a background worker.
+
     Environment variables:
     - ALERT_PAGERDUTY_ENABLED: true/false
     - PAGERDUTY_INTEGRATION_KEY: PagerDuty integration key
+    - ALERT_BATCH_SIZE: max alerts per flush (default 100)
+    - ALERT_BATCH_INTERVAL_MS: pause between flushes under load (default 200)
     """
     if not os.getenv("ALERT_PAGERDUTY_ENABLED", "false").lower() == "true":
         return
 
     # Only trigger PagerDuty for ERROR and CRITICAL
-    if alert.severity not in [AlertSeverity.ERROR, AlertSeverity.CRITICAL]:
+    if alert.severity not in _PAGERDUTY_SEVERITIES:
         return
 
-    try:
-        import requests
-
-        integration_key = os.getenv("PAGERDUTY_INTEGRATION_KEY")
-        if not integration_key:
-            logger.warning("PAGERDUTY_INTEGRATION_KEY not configured")
-            return
-
-        payload = {
-            "routing_key": integration_key,
-            "event_action": "trigger",
-            "dedup_key": alert.alert_id,
-            "payload": {
-                "summary": f"{alert.severity.value.upper()}: {alert.message}",
-                "severity": alert.severity.value,
-                "source": "kosmos-ai-scientist",
-                "timestamp": alert.timestamp.isoformat(),
-                "custom_details": alert.details
-            }
-        }
-
-        response = requests.post(
-            "https://events.pagerduty.com/v2/enqueue",
-            json=payload,
-            timeout=10
-        )
-        response.raise_for_status()
-
-        logger.info(f"PagerDuty notification sent for alert: {alert.name}")
-
-    except Exception as e:
-        logger.error(f"Failed to send PagerDuty notification: {e}")
+    _pagerduty_notifier.submit(alert)
 
 
 # Global alert manager instance
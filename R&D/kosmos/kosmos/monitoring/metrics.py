@@ -4,14 +4,23 @@ Prometheus metrics for Kosmos AI Scientist.
 Provides comprehensive metrics collection for monitoring and observability.
 """
 
+import gzip
 import logging
+import math
+import platform
+import re
+import sys
+import threading
 import time
+from functools import cached_property, lru_cache
 from typing import Dict, Any, Optional
 from contextlib import contextmanager
 
+from kosmos.models.domain import ScientificDomain
+
 try:
     from prometheus_client import (
-        Counter, Gauge, Histogram, Summary, Info,
+        Counter, Gauge, Histogram, Info,
         CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
     )
     PROMETHEUS_AVAILABLE = True
@@ -21,6 +30,114 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Cardinality guards: model and table names are potentially unbounded
+# (fine-tuned models per experiment, per-run tables), and every distinct
+# label value becomes a permanent time series in Prometheus.
+_MODEL_FAMILIES = ("claude", "gpt", "gemini", "llama", "mistral")
+
+# Per-run numeric or hex suffixes on table names (e.g. results_20240101,
+# tmp_a1b2c3d4e5f6). Quantified so multi-segment suffixes like
+# logs_2024_01_15 are stripped whole, not one period segment at a time.
+_TABLE_SUFFIX_RE = re.compile(r"(?:[_-](?:[0-9a-f]{8,}|\d+))*[_-]?(?:[0-9a-f]{8,}|\d+)$")
+
+# Histogram buckets are deliberately sparse: every bucket is its own time
+# series per label combination. Latency/duration histograms use log-linear
+# (HDR-style) edges from _hdr_buckets, bounding relative error across the
+# range in at most 8 buckets; the remaining histograms keep hand-picked
+# edges (evaluation: 1s/5s/30s/1min; convergence: iteration budget tiers;
+# quality: evaluator thresholds). +Inf is implicit.
+
+# Domains are free-form at the call sites (per-research-topic slugs are
+# possible); restrict the label to the supported scientific domains. The
+# mapping also canonicalizes to interned strings: label values recur
+# millions of times as dict keys, so duplicates collapse and tuple hashing
+# hits pointer-equality fast paths.
+_DOMAIN_CANON = {d.value: sys.intern(d.value) for d in ScientificDomain}
+_OTHER = sys.intern("other")
+
+# Computed once: platform.* calls can shell out on some systems, and the
+# values never change within a process
+_PLATFORM_INFO = {
+    'python_version': platform.python_version(),
+    'platform': platform.system(),
+    'architecture': platform.machine(),
+}
+
+
+def _hdr_buckets(lo: float, hi: float, rel_err: float, max_buckets: int = 8) -> list:
+    """
+    Log-linear (HDR-histogram-style) bucket edges spanning [lo, hi].
+
+    Edges grow geometrically so every bucket bounds the relative error of
+    an observation falling in it. If honouring rel_err would need more
+    than max_buckets edges, the growth factor is widened to span the range
+    in exactly max_buckets, trading resolution for series count.
+
+    Args:
+        lo: Smallest interesting value (first edge)
+        hi: Largest interesting value (last edge)
+        rel_err: Target relative error per bucket (0.5 = 50%)
+        max_buckets: Hard cap on the number of edges
+
+    Returns:
+        Sorted list of bucket edges
+    """
+    span = math.log(hi / lo)
+    n = min(int(math.ceil(span / math.log(1.0 + rel_err))) + 1, max_buckets)
+    ratio = math.exp(span / (n - 1))
+    return [round(lo * ratio ** k, 4) for k in range(n)]
+
+
+@lru_cache(maxsize=1024)
+def _bucket_model(model: str) -> str:
+    """Collapse a model name to a bounded family label."""
+    lowered = model.lower()
+    for family in _MODEL_FAMILIES:
+        if family in lowered:
+            return family
+    return _OTHER
+
+
+@lru_cache(maxsize=1024)
+def _classify_table(table: str) -> str:
+    """Strip per-run suffixes from a table name so the label stays bounded."""
+    return sys.intern(_TABLE_SUFFIX_RE.sub("", table)) or _OTHER
+
+
+def _noop(*args, **kwargs):
+    """Do nothing; stands in for every tracker on the null collector."""
+    return None
+
+
+class _NullMetricsCollector:
+    """
+    No-op stand-in returned when prometheus_client is not installed.
+
+    Every tracker resolves to a shared no-op function via __getattr__, so
+    callers pay one attribute lookup and an empty call instead of a branch.
+    """
+
+    # No per-instance state at all: no __dict__, and the class-level
+    # attributes serve every instance
+    __slots__ = ()
+
+    enabled = False
+
+    def __getattr__(self, name):
+        return _noop
+
+    @contextmanager
+    def track_hypothesis_evaluation(self):
+        yield
+
+    def export_metrics(self, accept_encoding: str = "") -> bytes:
+        return b""
+
+    def get_content_type(self) -> str:
+        # Mirrors prometheus_client's CONTENT_TYPE_LATEST, which is not
+        # importable when the package is missing
+        return "text/plain; version=0.0.4; charset=utf-8"
+
 
 class MetricsCollector:
     """
@@ -33,409 +150,554 @@ class MetricsCollector:
     - API calls and costs
     - Cache performance
     - System resources
+
+    Deliberately not slotted: the lazily-created metric families and
+    pre-bound hot methods are cached_property, which stores into the
+    instance __dict__; that laziness is worth more than the slotted
+    layout for the usual one-collector-per-process case.
     """
 
-    def __init__(self, registry: Optional[Any] = None):
+    def __new__(cls, registry: Optional[Any] = None, export_ttl_seconds: float = 0.5):
+        # Without prometheus_client every tracker would start with a dead
+        # enabled check; hand back the no-op collector instead so the real
+        # class carries no per-call guards.
+        if not PROMETHEUS_AVAILABLE:
+            return _NullMetricsCollector()
+        return super().__new__(cls)
+
+    def __init__(self, registry: Optional[Any] = None, export_ttl_seconds: float = 0.5):
         """
         Initialize metrics collector.
 
         Args:
             registry: Prometheus registry (optional, creates new if None)
+            export_ttl_seconds: How long a rendered export stays fresh;
+                near-simultaneous scrapes within this window share one
+                registry walk (0 disables caching)
         """
-        if not PROMETHEUS_AVAILABLE:
-            logger.warning("Prometheus metrics not available")
-            self.enabled = False
-            return
-
         self.enabled = True
         self.registry = registry or CollectorRegistry()
 
-        # Research metrics
-        self.research_cycles_total = Counter(
+        # Serialized-export cache: rendering is O(series) and HA scraper
+        # pairs tend to hit /metrics back to back
+        self._export_ttl = export_ttl_seconds
+        # (timestamp, raw bytes, gzip bytes or None if not yet compressed)
+        self._last_export: tuple = (float("-inf"), b"", None)
+        self._export_lock = threading.Lock()
+
+        # Bound label children cached by (metric id, label values), sharded
+        # per thread: prometheus_client's .labels() hashes the tuple and
+        # locks a dict on every call, and a single shared cache would just
+        # move that contention here. Shards only duplicate child references;
+        # the metric's own child map stays authoritative, so scrapes see
+        # every shard's increments.
+        self._tls = threading.local()
+
+        # Serializes batched gauge updates so concurrent system samplers
+        # don't interleave partially-written snapshots
+        self._batch_lock = threading.Lock()
+
+        # Cache operations are counted in a plain dict and folded into the
+        # Prometheus counter at export time: caches see orders of magnitude
+        # more ops than any other instrumented path, and a dict update is
+        # far cheaper than a child lookup plus mutex-guarded inc per hit
+        self._cache_op_buf: Dict[tuple, int] = {}
+
+        # Per-domain iteration counts, buffered the same way and folded
+        # into the by-domain counter at scrape time
+        self._domain_counts: Dict[str, int] = {}
+
+        logger.info("Prometheus metrics collector initialized")
+
+    # Metric families are created on first touch: eager construction of ~25
+    # collectors (label validation plus registry insertion apiece) is wasted
+    # startup latency for short-lived runs that use only a handful of them.
+
+    # Research metrics
+    @cached_property
+    def research_cycles_total(self):
+        return Counter(
             'kosmos_research_cycles_total',
             'Total number of research cycles started',
             ['domain', 'status'],
             registry=self.registry
         )
 
-        self.research_iterations_total = Counter(
+    @cached_property
+    def research_iterations_total(self):
+        return Counter(
             'kosmos_research_iterations_total',
             'Total number of research iterations',
+            registry=self.registry
+        )
+
+    @cached_property
+    def research_iterations_by_domain_total(self):
+        return Counter(
+            'kosmos_research_iterations_by_domain_total',
+            'Research iterations per scientific domain',
             ['domain'],
             registry=self.registry
         )
 
-        self.research_duration_seconds = Histogram(
+    @cached_property
+    def research_duration_seconds(self):
+        return Histogram(
             'kosmos_research_duration_seconds',
             'Research cycle duration in seconds',
-            ['domain', 'status'],
-            buckets=[60, 300, 600, 1800, 3600, 7200, 14400],  # 1min to 4hrs
+            ['status'],
+            buckets=_hdr_buckets(60, 14400, 0.5),
             registry=self.registry
         )
 
-        # Hypothesis metrics
-        self.hypotheses_generated_total = Counter(
+    # Hypothesis metrics
+    @cached_property
+    def hypotheses_generated_total(self):
+        return Counter(
             'kosmos_hypotheses_generated_total',
             'Total number of hypotheses generated',
             ['domain', 'strategy'],
             registry=self.registry
         )
 
-        self.hypotheses_tested_total = Counter(
+    @cached_property
+    def hypotheses_tested_total(self):
+        return Counter(
             'kosmos_hypotheses_tested_total',
             'Total number of hypotheses tested',
             ['domain', 'outcome'],
             registry=self.registry
         )
 
-        self.hypothesis_evaluation_duration_seconds = Histogram(
+    @cached_property
+    def hypothesis_evaluation_duration_seconds(self):
+        return Histogram(
             'kosmos_hypothesis_evaluation_duration_seconds',
             'Hypothesis evaluation duration',
-            buckets=[0.5, 1, 2, 5, 10, 30, 60],
+            buckets=[1, 5, 30, 60],
             registry=self.registry
         )
 
-        # Experiment metrics
-        self.experiments_total = Counter(
+    # Experiment metrics
+    @cached_property
+    def experiments_total(self):
+        return Counter(
             'kosmos_experiments_total',
             'Total number of experiments executed',
             ['domain', 'experiment_type', 'status'],
             registry=self.registry
         )
 
-        self.experiments_active = Gauge(
+    @cached_property
+    def experiments_active(self):
+        return Gauge(
             'kosmos_experiments_active',
             'Number of currently active experiments',
             registry=self.registry
         )
 
-        self.experiment_duration_seconds = Histogram(
+    @cached_property
+    def experiment_duration_seconds(self):
+        return Histogram(
             'kosmos_experiment_duration_seconds',
             'Experiment execution duration',
             ['experiment_type'],
-            buckets=[1, 5, 10, 30, 60, 300, 600, 1800],  # 1s to 30min
+            buckets=_hdr_buckets(1, 1800, 0.5),
             registry=self.registry
         )
 
-        # API call metrics
-        self.api_calls_total = Counter(
+    # API call metrics
+    @cached_property
+    def api_calls_total(self):
+        return Counter(
             'kosmos_api_calls_total',
             'Total number of API calls',
             ['api', 'model', 'status'],
             registry=self.registry
         )
 
-        self.api_tokens_total = Counter(
+    @cached_property
+    def api_tokens_total(self):
+        return Counter(
             'kosmos_api_tokens_total',
             'Total tokens used in API calls',
             ['api', 'model', 'token_type'],
             registry=self.registry
         )
 
-        self.api_cost_usd_total = Counter(
+    @cached_property
+    def api_cost_usd_total(self):
+        return Counter(
             'kosmos_api_cost_usd_total',
             'Total API cost in USD',
             ['api', 'model'],
             registry=self.registry
         )
 
-        self.api_latency_seconds = Histogram(
+    @cached_property
+    def api_latency_seconds(self):
+        return Histogram(
             'kosmos_api_latency_seconds',
             'API call latency',
             ['api', 'model'],
-            buckets=[0.1, 0.5, 1, 2, 5, 10, 30],
+            buckets=_hdr_buckets(0.05, 30, 0.5),
             registry=self.registry
         )
 
-        # Cache metrics
-        self.cache_operations_total = Counter(
+    # Cache metrics
+    @cached_property
+    def cache_operations_total(self):
+        return Counter(
             'kosmos_cache_operations_total',
             'Total cache operations',
             ['operation', 'cache_type', 'status'],
             registry=self.registry
         )
 
-        self.cache_hit_ratio = Gauge(
+    @cached_property
+    def cache_hit_ratio(self):
+        return Gauge(
             'kosmos_cache_hit_ratio',
             'Cache hit ratio (0.0-1.0)',
             ['cache_type'],
             registry=self.registry
         )
 
-        self.cache_size_bytes = Gauge(
+    @cached_property
+    def cache_size_bytes(self):
+        return Gauge(
             'kosmos_cache_size_bytes',
             'Current cache size in bytes',
             ['cache_type'],
             registry=self.registry
         )
 
-        self.cache_entries = Gauge(
+    @cached_property
+    def cache_entries(self):
+        return Gauge(
             'kosmos_cache_entries',
             'Number of entries in cache',
             ['cache_type'],
             registry=self.registry
         )
 
-        # Database metrics
-        self.database_queries_total = Counter(
+    # Database metrics
+    @cached_property
+    def database_queries_total(self):
+        return Counter(
             'kosmos_database_queries_total',
             'Total database queries',
-            ['operation', 'table', 'status'],
+            ['operation', 'table_class', 'status'],
             registry=self.registry
         )
 
-        self.database_query_duration_seconds = Histogram(
+    @cached_property
+    def database_query_duration_seconds(self):
+        return Histogram(
             'kosmos_database_query_duration_seconds',
             'Database query duration',
-            ['operation', 'table'],
-            buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1],
+            ['operation', 'table_class'],
+            buckets=_hdr_buckets(0.005, 1, 0.5),
             registry=self.registry
         )
 
-        self.database_connections_active = Gauge(
+    @cached_property
+    def database_connections_active(self):
+        return Gauge(
             'kosmos_database_connections_active',
             'Number of active database connections',
             registry=self.registry
         )
 
-        # System resource metrics
-        self.cpu_usage_percent = Gauge(
+    # System resource metrics
+    @cached_property
+    def cpu_usage_percent(self):
+        return Gauge(
             'kosmos_cpu_usage_percent',
             'CPU usage percentage',
             registry=self.registry
         )
 
-        self.memory_usage_bytes = Gauge(
+    @cached_property
+    def memory_usage_bytes(self):
+        return Gauge(
             'kosmos_memory_usage_bytes',
             'Memory usage in bytes',
             ['type'],  # rss, vms
             registry=self.registry
         )
 
-        self.disk_usage_bytes = Gauge(
+    @cached_property
+    def disk_usage_bytes(self):
+        return Gauge(
             'kosmos_disk_usage_bytes',
             'Disk usage in bytes',
             ['mount_point', 'type'],  # type: total, used, free
             registry=self.registry
         )
 
-        # Result quality metrics
-        self.result_quality_score = Summary(
+    # Result quality metrics
+    @cached_property
+    def result_quality_score(self):
+        # Histogram rather than Summary: observe() is a plain bucket
+        # increment instead of per-observation quantile-stream maintenance,
+        # and quantiles can be computed server-side
+        return Histogram(
             'kosmos_result_quality_score',
             'Result quality score distribution',
-            ['domain'],
+            buckets=[0.2, 0.4, 0.6, 0.8, 0.95],
             registry=self.registry
         )
 
-        self.convergence_iterations = Histogram(
+    @cached_property
+    def convergence_iterations(self):
+        return Histogram(
             'kosmos_convergence_iterations',
             'Number of iterations to convergence',
-            ['domain'],
-            buckets=[1, 3, 5, 10, 15, 20, 30, 50],
+            buckets=[5, 10, 20, 50],
             registry=self.registry
         )
 
-        # Info metric for version
-        self.info = Info(
+    @cached_property
+    def info(self):
+        info = Info(
             'kosmos_info',
             'Kosmos service information',
             registry=self.registry
         )
-        self._set_info()
-
-        logger.info("Prometheus metrics collector initialized")
+        self._set_info(info)
+        return info
+
+    # Pre-bound methods for the unlabeled metrics on the hottest trackers:
+    # one cached bound method beats a property hit plus attribute lookup
+    # on every observation.
+    @cached_property
+    def _research_iter_inc(self):
+        return self.research_iterations_total.inc
+
+    @cached_property
+    def _exp_active_inc(self):
+        return self.experiments_active.inc
+
+    @cached_property
+    def _exp_active_dec(self):
+        return self.experiments_active.dec
+
+    @cached_property
+    def _hypothesis_eval_timer(self):
+        return self.hypothesis_evaluation_duration_seconds.time
+
+    @cached_property
+    def _db_connections_set(self):
+        return self.database_connections_active.set
+
+    @cached_property
+    def _cpu_usage_set(self):
+        return self.cpu_usage_percent.set
+
+    @cached_property
+    def _system_gauge_setters(self):
+        # Bound set methods for the fixed system-metrics children, resolved
+        # once; update_system_metrics writes all six in one pass
+        return (
+            self._cpu_usage_set,
+            self._child(self.memory_usage_bytes, 'rss').set,
+            self._child(self.memory_usage_bytes, 'vms').set,
+            self._child(self.disk_usage_bytes, '/', 'total').set,
+            self._child(self.disk_usage_bytes, '/', 'used').set,
+            self._child(self.disk_usage_bytes, '/', 'free').set,
+        )
 
-    def _set_info(self):
+    def _batch_set(self, setters, values):
+        """Apply many gauge writes in a single critical section."""
+        with self._batch_lock:
+            for set_value, value in zip(setters, values):
+                set_value(value)
+
+    def _child(self, metric: Any, *label_values: str) -> Any:
+        """Get the bound child for the given label values, cached per thread."""
+        tls = self._tls
+        cache = getattr(tls, 'cache', None)
+        if cache is None:
+            cache = tls.cache = {}
+        key = (id(metric),) + label_values
+        child = cache.get(key)
+        if child is None:
+            child = cache[key] = metric.labels(*label_values)
+        return child
+
+    def _set_info(self, info):
         """Set service info metric."""
         try:
             from kosmos import __version__
-            import platform
-
-            self.info.info({
-                'version': __version__,
-                'python_version': platform.python_version(),
-                'platform': platform.system(),
-                'architecture': platform.machine()
-            })
-        except:
+
+            info.info({**_PLATFORM_INFO, 'version': __version__})
+        except Exception:
             pass
 
     # Research tracking
     def track_research_cycle(self, domain: str, status: str, duration: Optional[float] = None):
         """Track research cycle completion."""
-        if not self.enabled:
-            return
-
-        self.research_cycles_total.labels(domain=domain, status=status).inc()
+        domain = _DOMAIN_CANON.get(domain, _OTHER)
+        self._child(self.research_cycles_total, domain, sys.intern(status)).inc()
         if duration:
-            self.research_duration_seconds.labels(domain=domain, status=status).observe(duration)
+            self._child(self.research_duration_seconds, sys.intern(status)).observe(duration)
 
     def track_research_iteration(self, domain: str):
-        """Track research iteration."""
-        if not self.enabled:
-            return
-
-        self.research_iterations_total.labels(domain=domain).inc()
+        """Track research iteration (per-domain split buffered to scrape)."""
+        self._research_iter_inc()
+        domain = _DOMAIN_CANON.get(domain, _OTHER)
+        buf = self._domain_counts
+        buf[domain] = buf.get(domain, 0) + 1
 
     # Hypothesis tracking
     def track_hypothesis_generated(self, domain: str, strategy: str):
         """Track hypothesis generation."""
-        if not self.enabled:
-            return
-
-        self.hypotheses_generated_total.labels(domain=domain, strategy=strategy).inc()
+        self._child(self.hypotheses_generated_total, sys.intern(domain), sys.intern(strategy)).inc()
 
     def track_hypothesis_tested(self, domain: str, outcome: str):
         """Track hypothesis test completion."""
-        if not self.enabled:
-            return
-
-        self.hypotheses_tested_total.labels(domain=domain, outcome=outcome).inc()
+        self._child(self.hypotheses_tested_total, sys.intern(domain), sys.intern(outcome)).inc()
 
-    @contextmanager
     def track_hypothesis_evaluation(self):
         """Context manager to track hypothesis evaluation duration."""
-        if not self.enabled:
-            yield
-            return
-
-        start_time = time.time()
-        try:
-            yield
-        finally:
-            duration = time.time() - start_time
-            self.hypothesis_evaluation_duration_seconds.observe(duration)
+        # The library Timer is a plain object with __enter__/__exit__ and a
+        # monotonic clock; it avoids the generator frame a @contextmanager
+        # would create per measurement
+        return self._hypothesis_eval_timer()
 
     # Experiment tracking
     def track_experiment_start(self, domain: str, experiment_type: str):
         """Track experiment start."""
-        if not self.enabled:
-            return
-
-        self.experiments_active.inc()
+        self._exp_active_inc()
 
     def track_experiment_complete(self, domain: str, experiment_type: str, status: str, duration: float):
         """Track experiment completion."""
-        if not self.enabled:
-            return
-
-        self.experiments_total.labels(
-            domain=domain,
-            experiment_type=experiment_type,
-            status=status
-        ).inc()
-        self.experiments_active.dec()
-        self.experiment_duration_seconds.labels(experiment_type=experiment_type).observe(duration)
+        self._child(self.experiments_total, sys.intern(domain), sys.intern(experiment_type), sys.intern(status)).inc()
+        self._exp_active_dec()
+        self._child(self.experiment_duration_seconds, sys.intern(experiment_type)).observe(duration)
 
     # API tracking
     def track_api_call(self, api: str, model: str, status: str, latency: float,
                       input_tokens: int = 0, output_tokens: int = 0, cost_usd: float = 0.0):
         """Track API call metrics."""
-        if not self.enabled:
-            return
-
-        self.api_calls_total.labels(api=api, model=model, status=status).inc()
-        self.api_latency_seconds.labels(api=api, model=model).observe(latency)
+        api = sys.intern(api)
+        model = _bucket_model(model)
+        status = sys.intern(status)
+        self._child(self.api_calls_total, api, model, status).inc()
+        self._child(self.api_latency_seconds, api, model).observe(latency)
 
         if input_tokens > 0:
-            self.api_tokens_total.labels(api=api, model=model, token_type='input').inc(input_tokens)
+            self._child(self.api_tokens_total, api, model, 'input').inc(input_tokens)
         if output_tokens > 0:
-            self.api_tokens_total.labels(api=api, model=model, token_type='output').inc(output_tokens)
+            self._child(self.api_tokens_total, api, model, 'output').inc(output_tokens)
         if cost_usd > 0:
-            self.api_cost_usd_total.labels(api=api, model=model).inc(cost_usd)
+            self._child(self.api_cost_usd_total, api, model).inc(cost_usd)
 
     # Cache tracking
     def track_cache_operation(self, operation: str, cache_type: str, status: str):
-        """Track cache operation."""
-        if not self.enabled:
-            return
-
-        self.cache_operations_total.labels(
-            operation=operation,
-            cache_type=cache_type,
-            status=status
-        ).inc()
+        """Track cache operation (buffered; flushed at export time)."""
+        buf = self._cache_op_buf
+        key = (sys.intern(operation), sys.intern(cache_type), sys.intern(status))
+        buf[key] = buf.get(key, 0) + 1
+
+    def _flush_cache_ops(self):
+        """Fold buffered cache-operation counts into the Prometheus counter."""
+        if self._cache_op_buf:
+            # Swap the buffer out so concurrent trackers keep a fresh dict
+            buf, self._cache_op_buf = self._cache_op_buf, {}
+            for (operation, cache_type, status), n in buf.items():
+                self._child(self.cache_operations_total, operation, cache_type, status).inc(n)
+        if self._domain_counts:
+            buf, self._domain_counts = self._domain_counts, {}
+            for domain, n in buf.items():
+                self._child(self.research_iterations_by_domain_total, domain).inc(n)
 
     def update_cache_stats(self, cache_type: str, hit_ratio: float, size_bytes: int, entries: int):
         """Update cache statistics."""
-        if not self.enabled:
-            return
-
-        self.cache_hit_ratio.labels(cache_type=cache_type).set(hit_ratio)
-        self.cache_size_bytes.labels(cache_type=cache_type).set(size_bytes)
-        self.cache_entries.labels(cache_type=cache_type).set(entries)
+        cache_type = sys.intern(cache_type)
+        self._child(self.cache_hit_ratio, cache_type).set(hit_ratio)
+        self._child(self.cache_size_bytes, cache_type).set(size_bytes)
+        self._child(self.cache_entries, cache_type).set(entries)
 
     # Database tracking
     def track_database_query(self, operation: str, table: str, status: str, duration: float):
         """Track database query."""
-        if not self.enabled:
-            return
-
-        self.database_queries_total.labels(
-            operation=operation,
-            table=table,
-            status=status
-        ).inc()
-        self.database_query_duration_seconds.labels(
-            operation=operation,
-            table=table
-        ).observe(duration)
+        operation = sys.intern(operation)
+        table_class = _classify_table(table)
+        status = sys.intern(status)
+        self._child(self.database_queries_total, operation, table_class, status).inc()
+        self._child(self.database_query_duration_seconds, operation, table_class).observe(duration)
 
     def update_database_connections(self, count: int):
         """Update active database connections count."""
-        if not self.enabled:
-            return
-
-        self.database_connections_active.set(count)
+        self._db_connections_set(count)
 
     # System resource tracking
     def update_system_metrics(self, cpu_percent: float, memory_rss: int, memory_vms: int,
                              disk_total: int, disk_used: int, disk_free: int):
         """Update system resource metrics."""
-        if not self.enabled:
-            return
-
-        self.cpu_usage_percent.set(cpu_percent)
-        self.memory_usage_bytes.labels(type='rss').set(memory_rss)
-        self.memory_usage_bytes.labels(type='vms').set(memory_vms)
-        self.disk_usage_bytes.labels(mount_point='/', type='total').set(disk_total)
-        self.disk_usage_bytes.labels(mount_point='/', type='used').set(disk_used)
-        self.disk_usage_bytes.labels(mount_point='/', type='free').set(disk_free)
+        self._batch_set(
+            self._system_gauge_setters,
+            (cpu_percent, memory_rss, memory_vms, disk_total, disk_used, disk_free),
+        )
 
-    # Quality tracking
+    # Quality tracking (domain kept in the signature for compatibility; the
+    # label was dropped so histogram/summary series stay bounded)
     def track_result_quality(self, domain: str, score: float):
         """Track result quality score."""
-        if not self.enabled:
-            return
-
-        self.result_quality_score.labels(domain=domain).observe(score)
+        self.result_quality_score.observe(score)
 
     def track_convergence(self, domain: str, iterations: int):
         """Track convergence iterations."""
-        if not self.enabled:
-            return
-
-        self.convergence_iterations.labels(domain=domain).observe(iterations)
+        self.convergence_iterations.observe(iterations)
 
-    def export_metrics(self) -> bytes:
+    def export_metrics(self, accept_encoding: str = "") -> bytes:
         """
         Export metrics in Prometheus format.
 
+        Args:
+            accept_encoding: The scraper's Accept-Encoding header; if it
+                contains "gzip" the compressed form is returned (serve it
+                with Content-Encoding: gzip)
+
         Returns:
-            Metrics in Prometheus text format
+            Metrics in Prometheus text format, gzip-compressed on request
         """
-        if not self.enabled:
-            return b""
-
-        return generate_latest(self.registry)
+        want_gzip = "gzip" in accept_encoding
+        now = time.monotonic()
+        ts, body, compressed = self._last_export
+        if now - ts < self._export_ttl and (not want_gzip or compressed is not None):
+            return compressed if want_gzip else body
+        with self._export_lock:
+            ts, body, compressed = self._last_export
+            if not (now - ts < self._export_ttl):
+                # Touch the info metric so service metadata is always
+                # exported even though families are otherwise created lazily
+                self.info
+                self._flush_cache_ops()
+                body = generate_latest(self.registry)
+                compressed = None
+                ts = time.monotonic()
+            if want_gzip and compressed is None:
+                # level 1: metrics text is highly repetitive, so the cheap
+                # setting already compresses well
+                compressed = gzip.compress(body, compresslevel=1)
+            self._last_export = (ts, body, compressed)
+            return compressed if want_gzip else body
 
     def get_content_type(self) -> str:
         """Get content type for Prometheus metrics."""
         return CONTENT_TYPE_LATEST
 
+    def get_content_encoding(self) -> str:
+        """Content-Encoding to advertise for gzip-requested exports."""
+        return "gzip"
+
 
 # Global metrics collector instance
 _metrics_collector: Optional[MetricsCollector] = None
+_init_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
@@ -446,14 +708,21 @@ def get_metrics_collector() -> MetricsCollector:
         MetricsCollector instance
     """
     global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
-
-
-def export_metrics() -> bytes:
+    # Double-checked init: the uncontended fast path is one module-global
+    # load; the lock only matters for racing first calls, which would
+    # otherwise each register a collector.
+    collector = _metrics_collector
+    if collector is not None:
+        return collector
+    with _init_lock:
+        if _metrics_collector is None:
+            _metrics_collector = MetricsCollector()
+        return _metrics_collector
+
+
+def export_metrics(accept_encoding: str = "") -> bytes:
     """Export metrics in Prometheus format."""
-    return get_metrics_collector().export_metrics()
+    return get_metrics_collector().export_metrics(accept_encoding)
 
 
 def get_metrics_content_type() -> str:
@@ -9,16 +9,270 @@ Gap addressed: Gap 2 (Task Generation Strategy)
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
+import random
+import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 from datetime import datetime
+from time import perf_counter
 import yaml
 
+# libyaml-backed loader when available; same safe-load semantics, roughly
+# an order of magnitude faster to parse
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# C-implemented parser for the multi-KB LLM responses; orjson's
+# JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# except clauses keep working against either implementation
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+import anthropic
+
 from kosmos.core.llm import get_client
 
 logger = logging.getLogger(__name__)
 
+_AGENT_MODEL = "claude-3-5-sonnet-20241022"
+
+
+@lru_cache(maxsize=1)
+def _load_instructions() -> Mapping[str, str]:
+    """Load agent instructions once per process, shared across managers."""
+    instructions_path = Path(__file__).parent / "instructions.yaml"
+    with open(instructions_path) as f:
+        return MappingProxyType(yaml.load(f, Loader=_YamlLoader))
+
+_SEP = "=" * 80
+
+# Fenced JSON payload in an LLM response; one compiled scan replaces the
+# chained str.split calls each executor used to do
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Prompt templates split into static and dynamic pieces: the instruction
+# headers are baked into per-instance prefixes in __init__ and the schema
+# footers are assembled once at import, so each call only formats the
+# per-task body (the previous += chains re-allocated the growing string
+# on every statement). The JSON response schemas are kept as separate
+# constants so the body templates stay free of literal braces.
+
+_DATA_ANALYSIS_SCHEMA = """{
+  "summary": "2-line summary of key finding",
+  "statistics": {"p_value": <float>, "confidence": <float>, ...},
+  "methods": "Brief description of methods used",
+  "code_snippet": "Key code used (if applicable)",
+  "interpretation": "What this means for the research",
+  "next_steps": ["suggestion 1", "suggestion 2"]
+}
+"""
+
+_DATA_ANALYSIS_BODY = """**Task ID**: {task_id}
+**Description**: {description}
+**Expected Output**: {expected_output}
+
+{optional_blocks}**Research Context**:
+- Cycle: {cycle}/20
+- Current Findings: {findings_count}
+- Research Objective: {research_objective}
+
+{recent_findings_block}"""
+
+_DATA_ANALYSIS_FOOTER = (
+    f"{_SEP}\nEXECUTE THE TASK\n{_SEP}\n\n"
+    f"Perform the analysis and return your findings in JSON format:\n"
+    f"{_DATA_ANALYSIS_SCHEMA}"
+)
+
+_LITERATURE_REVIEW_SCHEMA = """{
+  "summary": "Key insights from literature",
+  "relevant_papers": [{"title": "...", "finding": "...", "relevance": "..."}, ...],
+  "gaps_identified": ["gap 1", "gap 2"],
+  "recommendations": ["recommendation 1", "recommendation 2"]
+}
+"""
+
+_LITERATURE_REVIEW_BODY = """**Task**: {description}
+**Focus**: {focus}
+
+{keywords_block}"""
+
+_LITERATURE_REVIEW_FOOTER = (
+    f"Conduct the literature review and return findings in JSON format:\n"
+    f"{_LITERATURE_REVIEW_SCHEMA}"
+)
+
+_HYPOTHESIS_GENERATION_SCHEMA = """{
+  "hypotheses": [
+    {"hypothesis": "...", "rationale": "...", "testability": "high/medium/low"},
+    ...
+  ]
+}
+"""
+
+_HYPOTHESIS_GENERATION_BODY = """**Task**: {description}
+**Current Findings**: {findings_count}
+
+{recent_findings_block}"""
+
+_HYPOTHESIS_GENERATION_FOOTER = (
+    f"Generate 3-5 new, testable hypotheses in JSON format:\n"
+    f"{_HYPOTHESIS_GENERATION_SCHEMA}"
+)
+
+_EXPERIMENT_DESIGN_SCHEMA = """{
+  "summary": "Experiment design overview",
+  "design": {
+    "approach": "...",
+    "methods": "...",
+    "controls": "...",
+    "sample_size": "..."
+  },
+  "expected_outcomes": ["outcome 1", "outcome 2"],
+  "resources_needed": ["resource 1", "resource 2"]
+}
+"""
+
+_EXPERIMENT_DESIGN_BODY = """**Task**: {description}
+**Hypothesis**: {hypothesis}
+
+"""
+
+_EXPERIMENT_DESIGN_FOOTER = (
+    f"Design the experiment and return in JSON format:\n"
+    f"{_EXPERIMENT_DESIGN_SCHEMA}"
+)
+
+_CODE_DEVELOPMENT_SCHEMA = """{
+  "summary": "2-line summary of what was implemented",
+  "code": "The implementation",
+  "tests": "Tests covering the implementation (if applicable)",
+  "usage_notes": "How to run or integrate the code"
+}
+"""
+
+_CODE_DEVELOPMENT_BODY = """**Task ID**: {task_id}
+**Description**: {description}
+**Expected Output**: {expected_output}
+
+{optional_blocks}"""
+
+_CODE_DEVELOPMENT_FOOTER = (
+    f"{_SEP}\nEXECUTE THE TASK\n{_SEP}\n\n"
+    f"Write the code and return your work in JSON format:\n"
+    f"{_CODE_DEVELOPMENT_SCHEMA}"
+)
+
+_GENERIC_TASK_BODY = """**Task**: {description}
+**Expected Output**: {expected_output}
+
+"""
+
+_GENERIC_TASK_FOOTER = "Execute the task and return findings in JSON format.\n"
+
+# Failures worth re-running the task for: transient network/server trouble
+# and timeouts. Everything else (malformed responses, bad task specs, auth
+# and other 4xx errors) is deterministic — a retry burns tokens and wall
+# time to reproduce the same failure.
+_RETRYABLE_EXCEPTIONS = (
+    anthropic.APIConnectionError,
+    anthropic.RateLimitError,
+    asyncio.TimeoutError,
+)
+
+
+def _recent_findings_block(
+    findings: list[dict[str, Any]],
+    limit: int,
+    numbered: bool,
+    header: str
+) -> str:
+    """Render the trailing `limit` findings as a prompt block ('' if empty)."""
+    recent = findings[-limit:]
+    if not recent:
+        return ""
+    if numbered:
+        lines = "\n".join(
+            f"{i}. {finding.get('summary', 'No summary')}"
+            for i, finding in enumerate(recent, 1)
+        )
+    else:
+        lines = "\n".join(
+            f"- {finding.get('summary', 'No summary')}"
+            for finding in recent
+        )
+    return header + lines + "\n\n"
+
+
+def _prime_findings_context(context: dict[str, Any]) -> None:
+    """
+    Bake the findings-derived prompt fragments into the context.
+
+    The findings list is fixed for the duration of a plan, so the slices
+    and formatted blocks are computed once here instead of per task (every
+    parallel task used to redo them).
+    """
+    findings = context.get("findings", [])
+    context["_findings_count"] = len(findings)
+    context["_recent_5_block"] = _recent_findings_block(
+        findings, 5, numbered=True, header="**Recent Findings** (for context):\n"
+    )
+    context["_recent_10_block"] = _recent_findings_block(
+        findings, 10, numbered=False, header="**Recent Findings**:\n"
+    )
+
+
+@dataclass(slots=True)
+class TaskState:
+    """Execution state for one task; the fields are always read together."""
+
+    status: str = "pending"
+    result: Optional[dict[str, Any]] = None
+    retries: int = 0
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Backoff policy for failed task executions.
+
+    Delays follow decorrelated jitter (delay = min(cap, uniform(base,
+    prev * multiplier))), which spreads resubmissions out instead of
+    letting parallel tasks retry in lockstep against the same API.
+    """
+
+    max_attempts: int = 3
+    initial_delay_ms: int = 500
+    max_delay_ms: int = 30000
+    multiplier: float = 3.0
+
+    def retryable(self, exc: Exception) -> bool:
+        """Whether a failure is worth re-running the task for."""
+        if isinstance(exc, _RETRYABLE_EXCEPTIONS):
+            return True
+        # 5xx means the server failed us; 4xx means the request itself is
+        # bad and will fail again
+        return isinstance(exc, anthropic.APIStatusError) and exc.status_code >= 500
+
+    def next_delay(self, prev_delay: float) -> float:
+        """Compute the next backoff delay in seconds."""
+        base = self.initial_delay_ms / 1000.0
+        cap = self.max_delay_ms / 1000.0
+        if prev_delay <= 0.0:
+            prev_delay = base
+        return min(cap, random.uniform(base, prev_delay * self.multiplier))
+
 
 class DelegationManager:
     """
@@ -31,11 +285,33 @@ class DelegationManager:
     4. Handling retries and failures
     """
 
+    # Fixed attribute set: slots drop the per-instance __dict__ and make
+    # the self.* loads in every executor a direct offset fetch
+    __slots__ = (
+        "client",
+        "max_parallel_tasks",
+        "max_retries",
+        "task_timeout_seconds",
+        "retry_policy",
+        "_http_sem",
+        "instructions",
+        "_data_analysis_prefix",
+        "_literature_review_prefix",
+        "_hypothesis_generation_prefix",
+        "_experiment_design_prefix",
+        "_code_development_prefix",
+        "_generic_task_prefix",
+        "_dispatch",
+        "tasks",
+        "_semantic_cache",
+    )
+
     def __init__(
         self,
         max_parallel_tasks: int = 3,
         max_retries: int = 2,
-        task_timeout_minutes: int = 120
+        task_timeout_minutes: int = 120,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         """
         Initialize delegation manager.
@@ -44,29 +320,92 @@ class DelegationManager:
             max_parallel_tasks: Max tasks to run in parallel
             max_retries: Max retry attempts for failed tasks
             task_timeout_minutes: Timeout for task execution
+            retry_policy: Backoff policy for retries (defaults to
+                decorrelated jitter with max_retries extra attempts)
         """
+        # get_client() returns the process-wide client (kosmos.core.llm
+        # caches it), so managers share one connection pool
         self.client = get_client()
         self.max_parallel_tasks = max_parallel_tasks
         self.max_retries = max_retries
         self.task_timeout_seconds = task_timeout_minutes * 60
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries + 1)
 
-        # Load agent instructions
-        instructions_path = Path(__file__).parent / "instructions.yaml"
-        with open(instructions_path) as f:
-            instructions = yaml.safe_load(f)
-            self.instructions = instructions
+        # Caps this manager's in-flight API requests so the shared pool
+        # can never be oversubscribed even if callers bypass execute_plan
+        # and invoke executors directly
+        self._http_sem = asyncio.Semaphore(max_parallel_tasks)
 
-        # Task execution tracking
-        self.task_status: Dict[str, str] = {}  # task_id -> status
-        self.task_results: Dict[str, Dict] = {}  # task_id -> result
-        self.task_retries: Dict[str, int] = {}  # task_id -> retry_count
+        # Agent instructions (parsed once per process, read-only)
+        self.instructions = _load_instructions()
+
+        # Prompt prefixes with the static instruction headers baked in, so
+        # each call formats only the per-task body
+        instr = self.instructions.get
+        self._data_analysis_prefix = (
+            f"{instr('data_analyst', '')}\n\n{_SEP}\nTASK SPECIFICATION\n{_SEP}\n\n"
+        )
+        self._literature_review_prefix = (
+            f"{instr('literature_analyzer', '')}\n\n{_SEP}\nLITERATURE REVIEW TASK\n{_SEP}\n\n"
+        )
+        self._hypothesis_generation_prefix = (
+            f"{instr('research_director', '')}\n\n"
+            f"Generate new hypotheses based on current research state.\n\n"
+        )
+        self._experiment_design_prefix = (
+            f"{instr('common_instructions', '')}\n\n"
+            f"Design an experiment to test a hypothesis.\n\n"
+        )
+        self._code_development_prefix = (
+            f"{instr('data_analyst', '')}\n\n{_SEP}\nCODE DEVELOPMENT TASK\n{_SEP}\n\n"
+        )
+        self._generic_task_prefix = f"{instr('common_instructions', '')}\n\n"
+
+        # Task-type routing table; unknown types fall through to the
+        # generic executor
+        self._dispatch = {
+            "data_analysis": self._execute_data_analysis,
+            "literature_review": self._execute_literature_review,
+            "hypothesis_generation": self._execute_hypothesis_generation,
+            "experiment_design": self._execute_experiment_design,
+            "code_development": self._execute_code_development,
+        }
+
+        # Task execution tracking: one state object per task instead of
+        # parallel dicts, so a state transition is a single lookup
+        self.tasks: dict[str, TaskState] = {}
+
+        # Results keyed by task content, so an identical task resubmitted
+        # in a later cycle is served from memory instead of re-calling the
+        # LLM; survives reset() deliberately
+        self._semantic_cache: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    async def create(cls, **kwargs: Any) -> "DelegationManager":
+        """
+        Construct a manager from inside a running event loop.
+
+        The first construction in a process reads and parses
+        instructions.yaml; doing that on the loop blocks every other
+        coroutine for the duration. This warms the process-wide
+        instructions cache on a worker thread first, so the synchronous
+        __init__ then finds it already populated.
+
+        Args:
+            **kwargs: Passed through to __init__
+
+        Returns:
+            Initialized DelegationManager
+        """
+        await asyncio.to_thread(_load_instructions)
+        return cls(**kwargs)
 
     async def execute_plan(
         self,
-        plan: Dict[str, Any],
+        plan: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Execute a research plan.
 
@@ -76,9 +415,9 @@ class DelegationManager:
             context: Current research state
 
         Returns:
-            Dict with:
-                - completed_tasks: List of completed task results
-                - failed_tasks: List of failed tasks
+            dict with:
+                - completed_tasks: list of completed task results
+                - failed_tasks: list of failed tasks
                 - execution_summary: Summary statistics
         """
         tasks = plan.get("tasks", [])
@@ -86,59 +425,76 @@ class DelegationManager:
 
         # Initialize tracking
         for task in tasks:
-            task_id = task.get("id", "unknown")
-            self.task_status[task_id] = "pending"
-            self.task_retries[task_id] = 0
+            self.tasks[task.get("id", "unknown")] = TaskState()
 
-        # Execute tasks in batches to respect parallel limit
         completed_tasks = []
         failed_tasks = []
 
-        # Group tasks by priority (if available) or maintain order
-        task_batches = self._create_task_batches(tasks)
-
-        for batch in task_batches:
-            logger.info(f"Executing batch of {len(batch)} tasks")
-
-            # Execute batch in parallel
-            batch_results = await asyncio.gather(
-                *[self._execute_task(task, cycle, context) for task in batch],
-                return_exceptions=True
-            )
-
-            # Process results
-            for task, result in zip(batch, batch_results):
+        # Findings don't change mid-plan; precompute the derived prompt
+        # fragments once for all tasks
+        _prime_findings_context(context)
+
+        # Spawn every task up front and gate concurrency with a semaphore:
+        # fixed-size batches would block each round on its slowest task,
+        # while here a new task starts the instant any slot frees.
+        semaphore = asyncio.Semaphore(self.max_parallel_tasks)
+        policy = self.retry_policy
+        retry_delays: dict[str, float] = {}  # task_id -> last backoff delay
+
+        async def bounded_execute(task: dict[str, Any], delay: float = 0.0):
+            # Sleep before taking a slot so a backing-off task doesn't
+            # hold up runnable work
+            if delay > 0.0:
+                await asyncio.sleep(delay)
+            async with semaphore:
+                try:
+                    # Enforce the task timeout so a hung call can't pin a
+                    # semaphore slot for the rest of the plan; timeouts are
+                    # retryable per RetryPolicy
+                    return task, await asyncio.wait_for(
+                        self._execute_task(task, cycle, context),
+                        timeout=self.task_timeout_seconds
+                    )
+                except Exception as e:
+                    return task, e
+
+        pending = [asyncio.create_task(bounded_execute(task)) for task in tasks]
+
+        while pending:
+            retries = []
+            for future in asyncio.as_completed(pending):
+                task, result = await future
                 task_id = task.get("id", "unknown")
 
+                state = self.tasks[task_id]
+
                 if isinstance(result, Exception):
                     logger.error(f"Task {task_id} failed with exception: {result}")
 
-                    # Retry if under limit
-                    if self.task_retries[task_id] < self.max_retries:
-                        self.task_retries[task_id] += 1
-                        logger.info(f"Retrying task {task_id} (attempt {self.task_retries[task_id]})")
-
-                        retry_result = await self._execute_task(task, cycle, context)
-
-                        if isinstance(retry_result, Exception):
-                            self.task_status[task_id] = "failed"
-                            failed_tasks.append({
-                                "task": task,
-                                "error": str(retry_result)
-                            })
-                        else:
-                            self.task_status[task_id] = "completed"
-                            completed_tasks.append(retry_result)
+                    # Resubmit with backoff if the failure is transient and
+                    # the attempt budget allows
+                    if state.retries + 1 < policy.max_attempts and policy.retryable(result):
+                        state.retries += 1
+                        delay = policy.next_delay(retry_delays.get(task_id, 0.0))
+                        retry_delays[task_id] = delay
+                        logger.info(
+                            f"Retrying task {task_id} in {delay:.2f}s "
+                            f"(attempt {state.retries})"
+                        )
+                        retries.append(asyncio.create_task(bounded_execute(task, delay)))
                     else:
-                        self.task_status[task_id] = "failed"
+                        state.status = "failed"
                         failed_tasks.append({
                             "task": task,
                             "error": str(result)
                         })
                 else:
-                    self.task_status[task_id] = "completed"
+                    state.status = "completed"
+                    state.result = result
                     completed_tasks.append(result)
 
+            pending = retries
+
         # Generate execution summary
         summary = self._generate_execution_summary(
             completed_tasks,
@@ -157,34 +513,12 @@ class DelegationManager:
             "execution_summary": summary
         }
 
-    def _create_task_batches(self, tasks: List[Dict]) -> List[List[Dict]]:
-        """
-        Create batches of tasks for parallel execution.
-
-        Respects max_parallel_tasks limit and tries to group independent tasks.
-        """
-        batches = []
-        current_batch = []
-
-        for task in tasks:
-            current_batch.append(task)
-
-            if len(current_batch) >= self.max_parallel_tasks:
-                batches.append(current_batch)
-                current_batch = []
-
-        # Add remaining tasks
-        if current_batch:
-            batches.append(current_batch)
-
-        return batches
-
     async def _execute_task(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Execute a single task by delegating to appropriate agent.
 
@@ -201,118 +535,117 @@ class DelegationManager:
 
         logger.info(f"Executing task {task_id} (type: {task_type})")
 
-        self.task_status[task_id] = "running"
-        start_time = datetime.utcnow()
+        self.tasks[task_id].status = "running"
+
+        # Identical task already executed (possibly in an earlier cycle):
+        # serve the cached result instead of paying for another LLM call
+        cache_key = self._cache_key(task)
+        cached = self._semantic_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Task {task_id} served from result cache")
+            result = copy.copy(cached)
+            result["task_id"] = task_id
+            result["task_type"] = task_type
+            result["cycle"] = cycle
+            result["execution_time_seconds"] = 0.0
+            result["completed_at"] = datetime.utcnow().isoformat()
+            return result
+
+        # perf_counter for the duration (monotonic, cheap); wall clock only
+        # for the human-readable completion stamp
+        start = perf_counter()
 
         try:
             # Delegate to appropriate agent based on task type
-            if task_type == "data_analysis":
-                result = await self._execute_data_analysis(task, cycle, context)
-            elif task_type == "literature_review":
-                result = await self._execute_literature_review(task, cycle, context)
-            elif task_type == "hypothesis_generation":
-                result = await self._execute_hypothesis_generation(task, cycle, context)
-            elif task_type == "experiment_design":
-                result = await self._execute_experiment_design(task, cycle, context)
-            elif task_type == "code_development":
-                result = await self._execute_code_development(task, cycle, context)
-            else:
-                # Generic task execution
-                result = await self._execute_generic_task(task, cycle, context)
+            handler = self._dispatch.get(task_type, self._execute_generic_task)
+            result = await handler(task, cycle, context)
 
             # Add metadata
             result["task_id"] = task_id
             result["task_type"] = task_type
             result["cycle"] = cycle
-            result["execution_time_seconds"] = (datetime.utcnow() - start_time).total_seconds()
+            result["execution_time_seconds"] = perf_counter() - start
             result["completed_at"] = datetime.utcnow().isoformat()
 
             logger.info(f"Task {task_id} completed successfully")
 
+            # Executors report their own failures as {"error": ...} results;
+            # only genuine successes are worth replaying
+            if "error" not in result:
+                self._semantic_cache[cache_key] = result
+
             return result
 
         except Exception as e:
             logger.error(f"Task {task_id} failed: {e}")
             raise
 
+    async def _query_agent(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> str:
+        """
+        Stream a completion from the agent model and return the full text.
+
+        Streaming overlaps server-side generation with client receive, so
+        task latency stops paying for the whole body transfer after the
+        last token; with the as_completed scheduler the saved time goes
+        straight to other tasks.
+        """
+        chunks: list[str] = []
+        async with self._http_sem:
+            async with self.client.messages.stream(
+                model=_AGENT_MODEL,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                # Let httpx cut off a stalled server well before the task
+                # timeout fires, so the failure surfaces as retryable
+                timeout=self.task_timeout_seconds
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+        return "".join(chunks)
+
     async def _execute_data_analysis(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Execute data analysis task using Data Analyst agent.
 
         This uses the data_analyst instructions from instructions.yaml
         and can integrate with the SkillLoader for domain expertise.
         """
-        instruction = self.instructions.get("data_analyst", "")
-
-        # Build prompt
-        prompt = f"{instruction}\n\n"
-        prompt += "=" * 80 + "\n"
-        prompt += "TASK SPECIFICATION\n"
-        prompt += "=" * 80 + "\n\n"
-        prompt += f"**Task ID**: {task.get('id')}\n"
-        prompt += f"**Description**: {task.get('description')}\n"
-        prompt += f"**Expected Output**: {task.get('expected_output')}\n\n"
-
+        optional_blocks = ""
         if task.get("required_skills"):
-            prompt += f"**Required Skills**: {', '.join(task.get('required_skills'))}\n\n"
-
+            optional_blocks += f"**Required Skills**: {', '.join(task.get('required_skills'))}\n\n"
         if task.get("data_sources"):
-            prompt += f"**Data Sources**: {task.get('data_sources')}\n\n"
-
-        # Add context
-        prompt += "**Research Context**:\n"
-        prompt += f"- Cycle: {cycle}/20\n"
-        prompt += f"- Current Findings: {len(context.get('findings', []))}\n"
-        prompt += f"- Research Objective: {context.get('research_objective', 'Not specified')}\n\n"
-
-        # Recent findings for context
-        recent_findings = context.get("findings", [])[-5:]
-        if recent_findings:
-            prompt += "**Recent Findings** (for context):\n"
-            for i, finding in enumerate(recent_findings, 1):
-                prompt += f"{i}. {finding.get('summary', 'No summary')}\n"
-            prompt += "\n"
-
-        prompt += "=" * 80 + "\n"
-        prompt += "EXECUTE THE TASK\n"
-        prompt += "=" * 80 + "\n\n"
-        prompt += "Perform the analysis and return your findings in JSON format:\n"
-        prompt += "{\n"
-        prompt += '  "summary": "2-line summary of key finding",\n'
-        prompt += '  "statistics": {"p_value": <float>, "confidence": <float>, ...},\n'
-        prompt += '  "methods": "Brief description of methods used",\n'
-        prompt += '  "code_snippet": "Key code used (if applicable)",\n'
-        prompt += '  "interpretation": "What this means for the research",\n'
-        prompt += '  "next_steps": ["suggestion 1", "suggestion 2"]\n'
-        prompt += "}\n"
+            optional_blocks += f"**Data Sources**: {task.get('data_sources')}\n\n"
+
+        # Prebaked by execute_plan; prime here for callers that invoke
+        # executors directly
+        if "_recent_5_block" not in context:
+            _prime_findings_context(context)
+
+        prompt = self._data_analysis_prefix + _DATA_ANALYSIS_BODY.format(
+            task_id=task.get("id"),
+            description=task.get("description"),
+            expected_output=task.get("expected_output"),
+            optional_blocks=optional_blocks,
+            cycle=cycle,
+            findings_count=context["_findings_count"],
+            research_objective=context.get("research_objective", "Not specified"),
+            recent_findings_block=context["_recent_5_block"],
+        ) + _DATA_ANALYSIS_FOOTER
 
         # Query LLM
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                messages=messages,
-                temperature=0.5
-            )
-
-            # Parse response
-            import json
-            response_text = response.content[0].text
-
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                json_text = response_text.split("```")[1].split("```")[0].strip()
-            else:
-                json_text = response_text
-
-            result = json.loads(json_text)
+            result = self._extract_json(await self._query_agent(prompt, 4000, 0.5))
 
             # Ensure required fields
             if "summary" not in result:
@@ -333,55 +666,26 @@ class DelegationManager:
 
     async def _execute_literature_review(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """
         Execute literature review task using Literature Analyzer agent.
         """
-        instruction = self.instructions.get("literature_analyzer", "")
-
-        # Build prompt
-        prompt = f"{instruction}\n\n"
-        prompt += "=" * 80 + "\n"
-        prompt += "LITERATURE REVIEW TASK\n"
-        prompt += "=" * 80 + "\n\n"
-        prompt += f"**Task**: {task.get('description')}\n"
-        prompt += f"**Focus**: {task.get('focus', 'General review')}\n\n"
-
+        keywords_block = ""
         if task.get("keywords"):
-            prompt += f"**Keywords**: {', '.join(task.get('keywords'))}\n\n"
+            keywords_block = f"**Keywords**: {', '.join(task.get('keywords'))}\n\n"
 
-        prompt += "Conduct the literature review and return findings in JSON format:\n"
-        prompt += "{\n"
-        prompt += '  "summary": "Key insights from literature",\n'
-        prompt += '  "relevant_papers": [{"title": "...", "finding": "...", "relevance": "..."}, ...],\n'
-        prompt += '  "gaps_identified": ["gap 1", "gap 2"],\n'
-        prompt += '  "recommendations": ["recommendation 1", "recommendation 2"]\n'
-        prompt += "}\n"
+        prompt = self._literature_review_prefix + _LITERATURE_REVIEW_BODY.format(
+            description=task.get("description"),
+            focus=task.get("focus", "General review"),
+            keywords_block=keywords_block,
+        ) + _LITERATURE_REVIEW_FOOTER
 
         # Query LLM
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=3000,
-                messages=messages,
-                temperature=0.4
-            )
-
-            # Parse response
-            import json
-            response_text = response.content[0].text
-
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                json_text = response_text
-
-            result = json.loads(json_text)
-            return result
+            return self._extract_json(await self._query_agent(prompt, 3000, 0.4))
 
         except Exception as e:
             logger.error(f"Literature review task failed: {e}")
@@ -395,53 +699,25 @@ class DelegationManager:
 
     async def _execute_hypothesis_generation(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """Execute hypothesis generation task."""
-        # Use research_director instruction for hypothesis generation
-        instruction = self.instructions.get("research_director", "")
-
-        prompt = f"{instruction}\n\n"
-        prompt += "Generate new hypotheses based on current research state.\n\n"
-        prompt += f"**Task**: {task.get('description')}\n"
-        prompt += f"**Current Findings**: {len(context.get('findings', []))}\n\n"
-
-        # Add recent findings
-        recent_findings = context.get("findings", [])[-10:]
-        if recent_findings:
-            prompt += "**Recent Findings**:\n"
-            for finding in recent_findings:
-                prompt += f"- {finding.get('summary', 'No summary')}\n"
-            prompt += "\n"
-
-        prompt += "Generate 3-5 new, testable hypotheses in JSON format:\n"
-        prompt += "{\n"
-        prompt += '  "hypotheses": [\n'
-        prompt += '    {"hypothesis": "...", "rationale": "...", "testability": "high/medium/low"},\n'
-        prompt += '    ...\n'
-        prompt += '  ]\n'
-        prompt += "}\n"
+        # Prebaked by execute_plan; prime here for callers that invoke
+        # executors directly
+        if "_recent_10_block" not in context:
+            _prime_findings_context(context)
+
+        prompt = self._hypothesis_generation_prefix + _HYPOTHESIS_GENERATION_BODY.format(
+            description=task.get("description"),
+            findings_count=context["_findings_count"],
+            recent_findings_block=context["_recent_10_block"],
+        ) + _HYPOTHESIS_GENERATION_FOOTER
 
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                messages=messages,
-                temperature=0.7  # Higher for creativity
-            )
-
-            import json
-            response_text = response.content[0].text
-
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                json_text = response_text
-
-            result = json.loads(json_text)
+            # Higher temperature for creativity
+            result = self._extract_json(await self._query_agent(prompt, 2000, 0.7))
             result["summary"] = f"Generated {len(result.get('hypotheses', []))} new hypotheses"
             return result
 
@@ -455,49 +731,18 @@ class DelegationManager:
 
     async def _execute_experiment_design(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """Execute experiment design task."""
-        instruction = self.instructions.get("common_instructions", "")
-
-        prompt = f"{instruction}\n\n"
-        prompt += "Design an experiment to test a hypothesis.\n\n"
-        prompt += f"**Task**: {task.get('description')}\n"
-        prompt += f"**Hypothesis**: {task.get('hypothesis', 'Not specified')}\n\n"
-
-        prompt += "Design the experiment and return in JSON format:\n"
-        prompt += "{\n"
-        prompt += '  "summary": "Experiment design overview",\n'
-        prompt += '  "design": {\n'
-        prompt += '    "approach": "...",\n'
-        prompt += '    "methods": "...",\n'
-        prompt += '    "controls": "...",\n'
-        prompt += '    "sample_size": "..."\n'
-        prompt += '  },\n'
-        prompt += '  "expected_outcomes": ["outcome 1", "outcome 2"],\n'
-        prompt += '  "resources_needed": ["resource 1", "resource 2"]\n'
-        prompt += "}\n"
+        prompt = self._experiment_design_prefix + _EXPERIMENT_DESIGN_BODY.format(
+            description=task.get("description"),
+            hypothesis=task.get("hypothesis", "Not specified"),
+        ) + _EXPERIMENT_DESIGN_FOOTER
 
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2500,
-                messages=messages,
-                temperature=0.6
-            )
-
-            import json
-            response_text = response.content[0].text
-
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                json_text = response_text
-
-            return json.loads(json_text)
+            return self._extract_json(await self._query_agent(prompt, 2500, 0.6))
 
         except Exception as e:
             logger.error(f"Experiment design failed: {e}")
@@ -509,54 +754,68 @@ class DelegationManager:
 
     async def _execute_code_development(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Execute code development task."""
-        # Similar to data_analysis but focused on code generation
-        return await self._execute_data_analysis(task, cycle, context)
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Execute code development task.
+
+        Uses a dedicated prompt rather than piggybacking on data analysis:
+        code tasks don't need the statistics schema or the recent-findings
+        context, which only padded the request and the billed output.
+        """
+        optional_blocks = ""
+        if task.get("required_skills"):
+            optional_blocks += f"**Required Skills**: {', '.join(task.get('required_skills'))}\n\n"
+
+        prompt = self._code_development_prefix + _CODE_DEVELOPMENT_BODY.format(
+            task_id=task.get("id"),
+            description=task.get("description"),
+            expected_output=task.get("expected_output"),
+            optional_blocks=optional_blocks,
+        ) + _CODE_DEVELOPMENT_FOOTER
+
+        try:
+            result = self._extract_json(await self._query_agent(prompt, 4000, 0.3))
+
+            if "summary" not in result:
+                result["summary"] = "Code development completed (no summary provided)"
+            if "code" not in result:
+                result["code"] = ""
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Code development task failed: {e}")
+            return {
+                "summary": f"Task {task.get('id')} execution failed: {str(e)}",
+                "code": "",
+                "error": str(e)
+            }
 
     async def _execute_generic_task(
         self,
-        task: Dict[str, Any],
+        task: dict[str, Any],
         cycle: int,
-        context: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        context: dict[str, Any]
+    ) -> dict[str, Any]:
         """Execute generic task with common instructions."""
-        instruction = self.instructions.get("common_instructions", "")
-
-        prompt = f"{instruction}\n\n"
-        prompt += f"**Task**: {task.get('description')}\n"
-        prompt += f"**Expected Output**: {task.get('expected_output', 'Analysis and findings')}\n\n"
-        prompt += "Execute the task and return findings in JSON format.\n"
+        prompt = self._generic_task_prefix + _GENERIC_TASK_BODY.format(
+            description=task.get("description"),
+            expected_output=task.get("expected_output", "Analysis and findings"),
+        ) + _GENERIC_TASK_FOOTER
 
         try:
-            messages = [{"role": "user", "content": prompt}]
-            response = await self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=3000,
-                messages=messages,
-                temperature=0.5
-            )
-
-            import json
-            response_text = response.content[0].text
-
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0].strip()
-            else:
-                # Try to extract any JSON
-                try:
-                    return json.loads(response_text)
-                except:
-                    # Return as summary
-                    return {
-                        "summary": response_text[:500],
-                        "full_response": response_text
-                    }
-
-            return json.loads(json_text)
+            response_text = await self._query_agent(prompt, 3000, 0.5)
+            try:
+                return self._extract_json(response_text)
+            except json.JSONDecodeError:
+                # Not JSON at all; return the raw text as a summary
+                return {
+                    "summary": response_text[:500],
+                    "full_response": response_text
+                }
 
         except Exception as e:
             logger.error(f"Generic task execution failed: {e}")
@@ -565,28 +824,49 @@ class DelegationManager:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _cache_key(task: dict[str, Any]) -> str:
+        """Content hash identifying a task across cycles."""
+        skills = ",".join(sorted(task.get("required_skills") or ()))
+        raw = f"{task.get('type')}|{task.get('description')}|{skills}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _extract_json(text: str) -> dict[str, Any]:
+        """
+        Parse the JSON payload of an LLM response.
+
+        Prefers a fenced ```json block; falls back to treating the whole
+        response as JSON.
+        """
+        match = _JSON_FENCE_RE.search(text)
+        if match:
+            return _loads(match.group(1))
+        return _loads(text)
+
     def _generate_execution_summary(
         self,
-        completed_tasks: List[Dict],
-        failed_tasks: List[Dict],
+        completed_tasks: list[dict],
+        failed_tasks: list[dict],
         cycle: int
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Generate summary of plan execution."""
         total_tasks = len(completed_tasks) + len(failed_tasks)
 
-        # Count task types
+        # One pass over the results: type counts and timing accumulate
+        # together, with no intermediate list of execution times
         task_types = {}
+        total_time = 0.0
+        n_timed = 0
         for task_result in completed_tasks:
             task_type = task_result.get("task_type", "unknown")
             task_types[task_type] = task_types.get(task_type, 0) + 1
+            exec_time = task_result.get("execution_time_seconds")
+            if exec_time is not None:
+                total_time += exec_time
+                n_timed += 1
 
-        # Calculate average execution time
-        execution_times = [
-            t.get("execution_time_seconds", 0)
-            for t in completed_tasks
-            if "execution_time_seconds" in t
-        ]
-        avg_time = sum(execution_times) / len(execution_times) if execution_times else 0
+        avg_time = total_time / n_timed if n_timed else 0
 
         summary = {
             "cycle": cycle,
@@ -596,21 +876,21 @@ class DelegationManager:
             "success_rate": len(completed_tasks) / total_tasks if total_tasks > 0 else 0,
             "task_types": task_types,
             "average_execution_time_seconds": round(avg_time, 1),
-            "total_execution_time_seconds": round(sum(execution_times), 1)
+            "total_execution_time_seconds": round(total_time, 1)
         }
 
         return summary
 
     def get_task_status(self, task_id: str) -> Optional[str]:
         """Get current status of a task."""
-        return self.task_status.get(task_id)
+        state = self.tasks.get(task_id)
+        return state.status if state else None
 
-    def get_task_result(self, task_id: str) -> Optional[Dict]:
+    def get_task_result(self, task_id: str) -> Optional[dict]:
         """Get result of a completed task."""
-        return self.task_results.get(task_id)
+        state = self.tasks.get(task_id)
+        return state.result if state else None
 
     def reset(self):
         """Reset tracking for new plan execution."""
-        self.task_status.clear()
-        self.task_results.clear()
-        self.task_retries.clear()
+        self.tasks.clear()
@@ -15,6 +15,7 @@ The novelty detector:
 """
 
 import logging
+import os
 from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from pathlib import Path
@@ -34,6 +35,139 @@ except ImportError:
     )
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+# Optional JIT for the keyword-fallback Jaccard loop
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional approximate nearest-neighbor index for large corpora
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Optional GPU for the similarity GEMMs: the index stays resident on the
+# device between checks, so only the query embedding crosses the bus
+try:
+    import torch
+    TORCH_CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    TORCH_CUDA_AVAILABLE = False
+
+# Below this corpus size the brute-force GEMV beats the ANN's graph
+# traversal overhead, so the HNSW index only engages past it
+_ANN_MIN_ROWS = 1000
+
+# Bound on the query-embedding cache (entries are one small vector each)
+_QUERY_CACHE_SIZE = 4096
+
+# Below this many distinct texts, single-process encoding beats paying
+# the multi-process pool's fork and IPC overhead
+_MULTI_PROCESS_MIN_TEXTS = 10_000
+
+
+def _token_hashes(text: str) -> np.ndarray:
+    """
+    Sorted, deduplicated uint64 token hashes for a text.
+
+    With numba the whole lower/split/hash pipeline runs fused over the
+    UTF-8 bytes (splitting on ASCII whitespace); the pure-Python fallback
+    tokenizes via str methods. The two produce different hash values, but
+    queries and corpus rows always go through the same path, which is all
+    the Jaccard kernel needs.
+    """
+    if NUMBA_AVAILABLE:
+        return _tokenize_hash(np.frombuffer(text.encode("utf-8"), dtype=np.uint8))
+    words = text.lower().split()
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    return np.unique(np.fromiter(
+        (hash(w) & 0xFFFFFFFFFFFFFFFF for w in words),
+        dtype=np.uint64,
+        count=len(words)
+    ))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _tokenize_hash(buf: np.ndarray) -> np.ndarray:  # pragma: no cover - compiled
+        """
+        Fused lowercase/split/hash over a UTF-8 byte buffer.
+
+        One pass folds ASCII uppercase to lowercase and accumulates a
+        64-bit FNV-1a hash per whitespace-delimited token, so the keyword
+        path allocates no lowercased copy and no per-word string objects.
+        Returns the sorted, deduplicated array the Jaccard kernel expects.
+        """
+        n = buf.shape[0]
+        hashes = np.empty(n // 2 + 1, dtype=np.uint64)
+        count = 0
+        h = np.uint64(0xCBF29CE484222325)  # FNV-1a offset basis
+        in_token = False
+        for i in range(n):
+            b = buf[i]
+            if b == 32 or 9 <= b <= 13:  # ASCII whitespace ends a token
+                if in_token:
+                    hashes[count] = h
+                    count += 1
+                    h = np.uint64(0xCBF29CE484222325)
+                    in_token = False
+            else:
+                if 65 <= b <= 90:
+                    b += 32
+                h = (h ^ np.uint64(b)) * np.uint64(0x100000001B3)  # FNV prime
+                in_token = True
+        if in_token:
+            hashes[count] = h
+            count += 1
+        out = np.sort(hashes[:count])
+        m = 0
+        for i in range(out.shape[0]):
+            if i == 0 or out[i] != out[i - 1]:
+                out[m] = out[i]
+                m += 1
+        return out[:m]
+
+
+    @njit(cache=True, parallel=True)
+    def _jaccard_batch(
+        query: np.ndarray,
+        offsets: np.ndarray,
+        data: np.ndarray
+    ) -> np.ndarray:  # pragma: no cover - compiled
+        """
+        Jaccard similarity of a query hash array against a packed corpus.
+
+        Each corpus row occupies data[offsets[r]:offsets[r+1]]; rows and
+        the query are sorted and deduplicated, so the intersection is a
+        two-pointer merge with no hashing.
+        """
+        n_rows = offsets.shape[0] - 1
+        n_query = query.shape[0]
+        out = np.empty(n_rows, dtype=np.float32)
+        for r in prange(n_rows):
+            i = 0
+            j = offsets[r]
+            end = offsets[r + 1]
+            inter = 0
+            while i < n_query and j < end:
+                a = query[i]
+                b = data[j]
+                if a == b:
+                    inter += 1
+                    i += 1
+                    j += 1
+                elif a < b:
+                    i += 1
+                else:
+                    j += 1
+            union = n_query + (end - offsets[r]) - inter
+            out[r] = inter / union if union > 0 else 0.0
+        return out
+
 
 class NoveltyDetector:
     """
@@ -47,7 +181,11 @@ class NoveltyDetector:
         self,
         model_name: str = "all-MiniLM-L6-v2",
         novelty_threshold: float = 0.75,
-        cache_dir: Optional[str] = None
+        cache_dir: Optional[str] = None,
+        quantize: str = "fp16",
+        num_threads: Optional[int] = None,
+        backend: str = "torch",
+        batch_size: int = 64
     ):
         """
         Initialize novelty detector.
@@ -60,14 +198,48 @@ class NoveltyDetector:
                              Tasks with similarity > threshold are flagged as redundant
                              Default 0.75 means tasks must be <75% similar to past work
             cache_dir: Directory to cache embeddings
+            quantize: Storage precision for the embedding index:
+                     'fp16' (default) halves index memory and disk size,
+                     'int8' quarters them, 'fp32' keeps full precision.
+                     Similarity scores are cosine in every mode; the
+                     precision loss is well below the 0.6/0.75 decision
+                     thresholds.
+            num_threads: Torch intra-op thread count for CPU encoding.
+                        Defaults to the KOSMOS_TORCH_THREADS environment
+                        variable, then the CPU count. Explicit tuning
+                        stops torch and the BLAS similarity step from
+                        oversubscribing the same cores.
+            backend: Inference backend for the encoder: 'torch' (default),
+                    'onnx', or 'openvino'. The optimized runtimes encode
+                    several times faster on CPU; they need the matching
+                    sentence-transformers extra installed, and fall back
+                    to torch if loading fails.
+            batch_size: Encoder batch size for bulk indexing and plan
+                       checks. 64 beats the library default of 32 on CPU
+                       and modest GPUs; lower it if encoding large
+                       corpora exhausts device memory.
         """
         self.novelty_threshold = novelty_threshold
         self.cache_dir = Path(cache_dir) if cache_dir else None
+        if backend not in ("torch", "onnx", "openvino"):
+            raise ValueError(f"backend must be 'torch', 'onnx', or 'openvino', got {backend!r}")
+        if quantize not in ("fp32", "fp16", "int8"):
+            raise ValueError(f"quantize must be 'fp32', 'fp16', or 'int8', got {quantize!r}")
+        self.embedding_dtype = {
+            "fp32": np.float32,
+            "fp16": np.float16,
+            "int8": np.int8,
+        }[quantize]
+        self.batch_size = batch_size
 
         # Initialize embedding model
         if SENTENCE_TRANSFORMERS_AVAILABLE:
+            # The fast tokenizers spawn their own thread pool per batch
+            # encode, which fights with torch's; keep them sequential
+            os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
             try:
-                self.model = SentenceTransformer(model_name)
+                self.model = self._load_model(model_name, backend)
+                self._tune_threads(num_threads)
                 self.use_embeddings = True
                 logger.info(f"Loaded sentence transformer: {model_name}")
             except Exception as e:
@@ -76,22 +248,493 @@ class NoveltyDetector:
         else:
             self.use_embeddings = False
 
-        # Vector index
-        self.task_embeddings: List[np.ndarray] = []
+        # Vector index: one contiguous float32 matrix per corpus, grown by
+        # doubling, with the row count tracked separately. Queries slice the
+        # live rows and hand them straight to BLAS — the previous list of
+        # per-row arrays had to be copied into a fresh matrix on every check.
+        self.task_emb_matrix: Optional[np.ndarray] = None
+        self._n_tasks = 0
         self.task_texts: List[str] = []
+        self.task_word_sets: List[frozenset] = []
         self.task_metadata: List[Dict] = []
 
         # Finding embeddings
-        self.finding_embeddings: List[np.ndarray] = []
+        self.finding_emb_matrix: Optional[np.ndarray] = None
+        self._n_findings = 0
         self.finding_texts: List[str] = []
+        self.finding_word_sets: List[frozenset] = []
         self.finding_metadata: List[Dict] = []
 
-    def index_past_tasks(self, tasks: List[Dict[str, Any]]):
+        # Token-hash arrays backing the JIT Jaccard kernel; the packed
+        # (offsets, data) form is built lazily and invalidated on append
+        self._task_hashes: List[np.ndarray] = []
+        self._finding_hashes: List[np.ndarray] = []
+        self._task_pack: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._finding_pack: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+        # Lazily built HNSW indexes over the embedding matrices; new rows
+        # are appended on the next query that needs them
+        self._task_ann = None
+        self._finding_ann = None
+
+        # Device-resident fp16 mirrors of the matrices when CUDA is
+        # present; caught up incrementally like the ANN indexes
+        self._use_cuda = TORCH_CUDA_AVAILABLE and self.use_embeddings
+        self._task_gpu = None
+        self._finding_gpu = None
+
+        # Corpus centroids with a bound on the max row deviation, used to
+        # prove "no row can be similar enough" in O(D) before the full
+        # scan; rebuilt lazily after load_index
+        self._task_mean: Optional[np.ndarray] = None
+        self._task_dev = 0.0
+        self._finding_mean: Optional[np.ndarray] = None
+        self._finding_dev = 0.0
+
+        # Query embeddings by text: replanning loops re-check the same or
+        # barely-changed tasks, and the encoder forward pass dominates
+        # query cost. Bounded FIFO, evicting oldest first.
+        self._query_emb_cache: Dict[str, np.ndarray] = {}
+
+    def _cache_query_embedding(self, text: str, embedding: np.ndarray) -> None:
+        """Insert a query embedding, evicting the oldest entry when full."""
+        cache = self._query_emb_cache
+        if len(cache) >= _QUERY_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[text] = embedding
+
+    def _get_or_encode(self, text: str) -> np.ndarray:
+        """Unit-length float32 embedding for a query text, cached by text."""
+        embedding = self._query_emb_cache.get(text)
+        if embedding is None:
+            embedding = self._encode([text])[0]
+            self._cache_query_embedding(text, embedding)
+        return embedding
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts to unit-length float32 embeddings in one batched call.
+
+        On CUDA the forward pass runs under inference_mode with fp16
+        autocast, which roughly doubles tensor-core throughput; the
+        returned embeddings are float32 either way.
+        """
+        if self._use_cuda:
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda", dtype=torch.float16
+            ):
+                embeddings = self.model.encode(
+                    texts,
+                    batch_size=self.batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
+        else:
+            embeddings = self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+        return embeddings.astype(np.float32, copy=False)
+
+    def _encode_dedup(
+        self,
+        texts: List[str],
+        multi_process: bool = False
+    ) -> np.ndarray:
+        """
+        Encode texts, running the model only over distinct ones.
+
+        Replayed logs commonly repeat the same task text many times; the
+        encoder forward pass dominates indexing cost, so encoding each
+        distinct text once and expanding by index is a pure win. Costs
+        one dict pass when all texts are unique.
+        """
+        index: Dict[str, int] = {}
+        for t in texts:
+            index.setdefault(t, len(index))
+        encode = self._encode
+        if multi_process and len(index) > _MULTI_PROCESS_MIN_TEXTS:
+            encode = self._encode_multi_process
+        if len(index) == len(texts):
+            return encode(texts)
+        unique_embs = encode(list(index))
+        return unique_embs[[index[t] for t in texts]]
+
+    def _encode_multi_process(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode a bulk job across a sentence-transformers worker pool.
+
+        The pool is created per call and torn down afterwards: bulk
+        indexing is rare enough that keeping idle workers (one model copy
+        each) resident isn't worth the memory.
+        """
+        if self._use_cuda:
+            # Let the library enumerate the CUDA devices itself
+            pool = self.model.start_multi_process_pool()
+        else:
+            pool = self.model.start_multi_process_pool(
+                target_devices=["cpu"] * min(4, os.cpu_count() or 1)
+            )
+        try:
+            embeddings = self.model.encode_multi_process(
+                texts,
+                pool,
+                batch_size=self.batch_size,
+                normalize_embeddings=True
+            )
+        finally:
+            self.model.stop_multi_process_pool(pool)
+        return embeddings.astype(np.float32, copy=False)
+
+    def _load_model(self, model_name: str, backend: str) -> "SentenceTransformer":
+        """
+        Construct the encoder on the requested inference backend.
+
+        sentence-transformers 3.x exports the model to ONNX Runtime or
+        OpenVINO on first load when backend= is passed (the export is
+        cached alongside the model), which typically encodes 2-3x faster
+        on CPU than eager torch. If the optimized runtime is missing or
+        the export fails, fall back to the torch backend rather than
+        losing embeddings entirely.
+        """
+        kwargs: Dict[str, Any] = {}
+        if self.cache_dir:
+            kwargs["cache_folder"] = str(self.cache_dir)
+        if backend == "torch":
+            return SentenceTransformer(model_name, **kwargs)
+        try:
+            return SentenceTransformer(model_name, backend=backend, **kwargs)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load {backend} backend: {e}. Falling back to torch."
+            )
+            return SentenceTransformer(model_name, **kwargs)
+
+    @staticmethod
+    def _tune_threads(num_threads: Optional[int]) -> None:
+        """
+        Pin torch's CPU thread counts for the encoder.
+
+        Library defaults take one intra-op thread per core and then
+        contend with the BLAS threads of the similarity GEMV; one shared
+        pool sized explicitly avoids the oversubscription.
+        """
+        try:
+            import torch
+        except ImportError:
+            return
+        if num_threads is None:
+            num_threads = int(os.environ.get(
+                "KOSMOS_TORCH_THREADS", os.cpu_count() or 1
+            ))
+        torch.set_num_threads(num_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before torch's pools start; keep the default
+            pass
+
+    @staticmethod
+    def _pack_hashes(arrays: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack per-row hash arrays into (offsets, flat data) for the kernel."""
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        for i, row in enumerate(arrays):
+            offsets[i + 1] = offsets[i] + row.shape[0]
+        data = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.uint64)
+        return offsets, data
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize each row in place (zero rows are left alone).
+
+        Indexed and query embeddings are normalized once, so every
+        similarity afterwards is a plain dot product that is already a
+        cosine score — no per-query, per-row norms on the hot path.
+        """
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+        matrix /= norms
+        return matrix
+
+    def _quantize(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Cast unit-length float embeddings to the configured index dtype.
+
+        int8 uses symmetric scaling by 127 (components of a unit vector
+        lie in [-1, 1]); _similarity divides the integer dot product by
+        127^2 to recover a cosine score.
+        """
+        if self.embedding_dtype == np.int8:
+            return np.clip(np.round(embeddings * 127.0), -127, 127).astype(np.int8)
+        return embeddings.astype(self.embedding_dtype, copy=False)
+
+    def _similarity(self, index_rows: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarities of normalized float32 queries against index rows.
+
+        Args:
+            index_rows: (N, D) live slice of an index matrix
+            queries: (D,) or (P, D) unit-length float32 embeddings
+
+        Returns:
+            float32 similarities of shape (N,) or (P, N)
+        """
+        if index_rows.dtype == np.int8:
+            q = self._quantize(queries).astype(np.float32)
+            sims = np.matmul(q, index_rows.T.astype(np.float32))
+            sims /= 127.0 * 127.0
+            return sims
+        if index_rows.dtype == np.float16:
+            return np.matmul(queries.astype(np.float16), index_rows.T).astype(np.float32)
+        return np.matmul(queries, index_rows.T)
+
+    @staticmethod
+    def _dequantize_rows(rows: np.ndarray) -> np.ndarray:
+        """Recover float32 unit vectors from index rows of any precision."""
+        if rows.dtype == np.int8:
+            return rows.astype(np.float32) / 127.0
+        return rows.astype(np.float32, copy=False)
+
+    def _ensure_ann(self, corpus: str):
+        """
+        Get the HNSW index for a corpus, creating it and appending any rows
+        added since the last query.
+        """
+        if corpus == "task":
+            matrix, n, ann = self.task_emb_matrix, self._n_tasks, self._task_ann
+        else:
+            matrix, n, ann = self.finding_emb_matrix, self._n_findings, self._finding_ann
+
+        if ann is None:
+            # Inner product on unit vectors == cosine
+            ann = hnswlib.Index(space="ip", dim=matrix.shape[1])
+            ann.init_index(max_elements=max(2048, n), M=16, ef_construction=200)
+            ann.set_ef(64)
+            if corpus == "task":
+                self._task_ann = ann
+            else:
+                self._finding_ann = ann
+
+        count = ann.get_current_count()
+        if count < n:
+            if n > ann.get_max_elements():
+                ann.resize_index(max(n, 2 * ann.get_max_elements()))
+            ann.add_items(
+                self._dequantize_rows(matrix[count:n]), np.arange(count, n)
+            )
+        return ann
+
+    def _ensure_centroid(self, corpus: str) -> None:
+        """
+        Build a corpus's centroid and deviation bound from its live rows
+        if missing (first use after load_index, which defers the pass so
+        memory-mapped loads stay lazy).
+        """
+        if corpus == "task":
+            mean, n, matrix = self._task_mean, self._n_tasks, self.task_emb_matrix
+        else:
+            mean, n, matrix = self._finding_mean, self._n_findings, self.finding_emb_matrix
+        if mean is not None or not n:
+            return
+        rows = self._dequantize_rows(matrix[:n])
+        mean = rows.mean(axis=0).astype(np.float32, copy=False)
+        dev = float(np.sqrt(((rows - mean) ** 2).sum(axis=1)).max())
+        if corpus == "task":
+            self._task_mean, self._task_dev = mean, dev
+        else:
+            self._finding_mean, self._finding_dev = mean, dev
+
+    @staticmethod
+    def _update_centroid(
+        mean: Optional[np.ndarray],
+        dev: float,
+        old_n: int,
+        rows: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Fold appended rows into a running centroid and deviation bound.
+
+        The old rows' deviation from the new mean is bounded by their old
+        deviation plus the mean's shift, so the bound loosens slightly on
+        every append instead of requiring a rescan.
+        """
+        new_n = old_n + rows.shape[0]
+        if mean is None:
+            new_mean = rows.mean(axis=0)
+            shift = 0.0
+        else:
+            new_mean = (mean * old_n + rows.sum(axis=0)) / new_n
+            shift = float(np.linalg.norm(new_mean - mean))
+        new_dev = max(
+            dev + shift,
+            float(np.sqrt(((rows - new_mean) ** 2).sum(axis=1)).max())
+        )
+        return new_mean.astype(np.float32, copy=False), new_dev
+
+    def _centroid_bound(self, corpus: str, query: np.ndarray) -> Optional[float]:
+        """
+        Upper bound on any corpus row's similarity to a unit query.
+
+        For unit rows, q.x = q.mean + q.(x - mean) <= q.mean + ||x - mean||,
+        so one D-wide dot product bounds the whole N x D scan.
+        """
+        self._ensure_centroid(corpus)
+        if corpus == "task":
+            mean, dev = self._task_mean, self._task_dev
+        else:
+            mean, dev = self._finding_mean, self._finding_dev
+        if mean is None:
+            return None
+        return float(np.dot(query, mean)) + dev
+
+    def _gpu_rows(self, corpus: str):
+        """
+        Device-resident fp16 tensor of a corpus's live rows.
+
+        New rows since the last query are dequantized and torch.cat'ed
+        onto the cached tensor, so steady-state checks upload only the
+        query vector.
+        """
+        if corpus == "task":
+            matrix, n, tensor = self.task_emb_matrix, self._n_tasks, self._task_gpu
+        else:
+            matrix, n, tensor = self.finding_emb_matrix, self._n_findings, self._finding_gpu
+
+        count = 0 if tensor is None else tensor.shape[0]
+        if count < n:
+            new = torch.from_numpy(
+                self._dequantize_rows(matrix[count:n])
+            ).to("cuda", dtype=torch.float16)
+            tensor = new if tensor is None else torch.cat((tensor, new))
+            if corpus == "task":
+                self._task_gpu = tensor
+            else:
+                self._finding_gpu = tensor
+        return tensor
+
+    def _gpu_similarity(self, corpus: str, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarities against a corpus, computed on the GPU."""
+        rows = self._gpu_rows(corpus)
+        q = torch.from_numpy(np.ascontiguousarray(queries)).to(
+            "cuda", dtype=torch.float16
+        )
+        return (q @ rows.T).float().cpu().numpy()
+
+    def _corpus_similarity(self, corpus: str, queries: np.ndarray) -> np.ndarray:
+        """
+        Similarities of queries against a corpus's live rows, routed to
+        the GPU when one is available. A GPU failure (OOM, driver) logs
+        once and permanently drops back to the BLAS path.
+        """
+        if self._use_cuda:
+            try:
+                return self._gpu_similarity(corpus, queries)
+            except Exception as e:
+                logger.warning(f"GPU similarity failed: {e}. Falling back to CPU.")
+                self._use_cuda = False
+                self._task_gpu = None
+                self._finding_gpu = None
+        if corpus == "task":
+            return self._similarity(self.task_emb_matrix[:self._n_tasks], queries)
+        return self._similarity(self.finding_emb_matrix[:self._n_findings], queries)
+
+    def _top_similar(
+        self,
+        corpus: str,
+        query: np.ndarray,
+        key: str
+    ) -> Tuple[float, List[Dict[str, Any]]]:
+        """
+        Max similarity and top similar items for one corpus.
+
+        With a GPU the exact GEMV runs on the device for any corpus size.
+        On CPU, large corpora go through the approximate HNSW index
+        (top-10 probe, ~O(log N) per query); small ones use the exact
+        GEMV, where brute force is faster than graph traversal.
+        """
+        if corpus == "task":
+            n, matrix, metadata = self._n_tasks, self.task_emb_matrix, self.task_metadata
+        else:
+            n, matrix, metadata = self._n_findings, self.finding_emb_matrix, self.finding_metadata
+
+        if not n:
+            return 0.0, []
+
+        # O(D) rejection: when the centroid bound proves every row sits
+        # below both the similar-item cutoff and the novelty threshold,
+        # the full scan can't change the verdict
+        bound = self._centroid_bound(corpus, query)
+        if bound is not None and bound < min(0.6, self.novelty_threshold):
+            return max(bound, 0.0), []
+
+        if not self._use_cuda and HNSWLIB_AVAILABLE and n >= _ANN_MIN_ROWS:
+            ann = self._ensure_ann(corpus)
+            labels, distances = ann.knn_query(query, k=min(10, n))
+            sims = 1.0 - distances[0]
+            items = [
+                {key: metadata[int(label)], "similarity": round(float(sim), 3)}
+                for label, sim in zip(labels[0], sims)
+                if sim > 0.6
+            ][:3]
+            return (float(sims[0]) if sims.size else 0.0), items
+
+        sims = self._corpus_similarity(corpus, query)
+        return float(sims.max()), self._similar_items(sims, metadata, key)
+
+    @staticmethod
+    def _append_rows(
+        matrix: Optional[np.ndarray],
+        n: int,
+        rows: np.ndarray
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Append embedding rows to a capacity-doubling matrix.
+
+        Args:
+            matrix: Existing (capacity, dim) matrix, or None
+            n: Number of rows currently in use
+            rows: New (k, dim) embeddings to append (already quantized to
+                the index dtype)
+
+        Returns:
+            Tuple of (matrix, new row count); matrix may be reallocated
+        """
+        rows = np.ascontiguousarray(rows)
+        k = rows.shape[0]
+        if matrix is None:
+            capacity = max(64, k)
+            matrix = np.empty((capacity, rows.shape[1]), dtype=rows.dtype)
+        elif n + k > matrix.shape[0] or not matrix.flags.writeable:
+            # Read-only matrices (memory-mapped loads) are sized exactly to
+            # their rows; grow into an owned writable array before appending
+            capacity = matrix.shape[0]
+            while capacity < n + k:
+                capacity *= 2
+            grown = np.empty((capacity, matrix.shape[1]), dtype=matrix.dtype)
+            grown[:n] = matrix[:n]
+            matrix = grown
+        matrix[n:n + k] = rows
+        return matrix, n + k
+
+    def index_past_tasks(
+        self,
+        tasks: List[Dict[str, Any]],
+        multi_process: bool = False
+    ):
         """
         Index past tasks for similarity comparison.
 
         Args:
             tasks: List of past task dicts with 'description' field
+            multi_process: Spread encoding across worker processes for
+                          bulk jobs (e.g. replaying a full task log).
+                          Only engages past 10k distinct texts, where the
+                          near-linear speedup outweighs the fork and IPC
+                          overhead.
         """
         if not tasks:
             return
@@ -110,20 +753,27 @@ class NoveltyDetector:
         # Generate embeddings
         if self.use_embeddings:
             try:
-                embeddings = self.model.encode(task_texts, convert_to_numpy=True)
-                self.task_embeddings.extend(embeddings)
-                self.task_texts.extend(task_texts)
-                self.task_metadata.extend(tasks)
+                embeddings = self._encode_dedup(task_texts, multi_process)
+                self._ensure_centroid("task")
+                old_n = self._n_tasks
+                self.task_emb_matrix, self._n_tasks = self._append_rows(
+                    self.task_emb_matrix, self._n_tasks,
+                    self._quantize(embeddings)
+                )
+                self._task_mean, self._task_dev = self._update_centroid(
+                    self._task_mean, self._task_dev, old_n, embeddings
+                )
                 logger.info(f"Indexed {len(embeddings)} task embeddings")
             except Exception as e:
                 logger.error(f"Failed to generate embeddings: {e}")
-                # Fall back to text matching
-                self.task_texts.extend(task_texts)
-                self.task_metadata.extend(tasks)
-        else:
-            # Just store texts for keyword matching
-            self.task_texts.extend(task_texts)
-            self.task_metadata.extend(tasks)
+
+        # Texts, precomputed token sets (for the keyword fallback), and
+        # metadata are kept on every path
+        self.task_texts.extend(task_texts)
+        self.task_word_sets.extend(frozenset(t.lower().split()) for t in task_texts)
+        self.task_metadata.extend(tasks)
+        self._task_hashes.extend(_token_hashes(t) for t in task_texts)
+        self._task_pack = None
 
     def index_findings(self, findings: List[Dict[str, Any]]):
         """
@@ -143,18 +793,25 @@ class NoveltyDetector:
         # Generate embeddings
         if self.use_embeddings:
             try:
-                embeddings = self.model.encode(finding_texts, convert_to_numpy=True)
-                self.finding_embeddings.extend(embeddings)
-                self.finding_texts.extend(finding_texts)
-                self.finding_metadata.extend(findings)
+                embeddings = self._encode_dedup(finding_texts)
+                self._ensure_centroid("finding")
+                old_n = self._n_findings
+                self.finding_emb_matrix, self._n_findings = self._append_rows(
+                    self.finding_emb_matrix, self._n_findings,
+                    self._quantize(embeddings)
+                )
+                self._finding_mean, self._finding_dev = self._update_centroid(
+                    self._finding_mean, self._finding_dev, old_n, embeddings
+                )
                 logger.info(f"Indexed {len(embeddings)} finding embeddings")
             except Exception as e:
                 logger.error(f"Failed to generate embeddings: {e}")
-                self.finding_texts.extend(finding_texts)
-                self.finding_metadata.extend(findings)
-        else:
-            self.finding_texts.extend(finding_texts)
-            self.finding_metadata.extend(findings)
+
+        self.finding_texts.extend(finding_texts)
+        self.finding_word_sets.extend(frozenset(t.lower().split()) for t in finding_texts)
+        self.finding_metadata.extend(findings)
+        self._finding_hashes.extend(_token_hashes(t) for t in finding_texts)
+        self._finding_pack = None
 
     def check_task_novelty(
         self,
@@ -178,7 +835,7 @@ class NoveltyDetector:
         task_type = task.get("type", "unknown")
         text = f"{task_type}: {description}"
 
-        if self.use_embeddings and self.task_embeddings:
+        if self.use_embeddings and self._n_tasks:
             return self._check_novelty_embeddings(text, task)
         else:
             return self._check_novelty_keywords(text, task)
@@ -188,61 +845,27 @@ class NoveltyDetector:
         text: str,
         task: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Check novelty using semantic embeddings."""
+        """
+        Check novelty using semantic embeddings.
+
+        All stored and query embeddings are unit-length, so the dot
+        products below are cosine similarities in [-1, 1].
+        """
         try:
-            # Encode proposed task
-            task_embedding = self.model.encode([text], convert_to_numpy=True)[0]
-
-            # Compute similarities to past tasks
-            task_similarities = []
-            if self.task_embeddings:
-                task_embeddings_matrix = np.array(self.task_embeddings)
-                similarities = np.dot(task_embeddings_matrix, task_embedding)
-                task_similarities = similarities.tolist()
-
-            # Compute similarities to findings
-            finding_similarities = []
-            if self.finding_embeddings:
-                finding_embeddings_matrix = np.array(self.finding_embeddings)
-                similarities = np.dot(finding_embeddings_matrix, task_embedding)
-                finding_similarities = similarities.tolist()
-
-            # Find maximum similarity
-            max_task_sim = max(task_similarities) if task_similarities else 0.0
-            max_finding_sim = max(finding_similarities) if finding_similarities else 0.0
+            # Encode proposed task (cached by text across re-checks)
+            task_embedding = self._get_or_encode(text)
+
+            # Per-corpus max similarity and top matches: exact GEMV for
+            # small corpora, HNSW probe for large ones
+            max_task_sim, similar_tasks = self._top_similar("task", task_embedding, "task")
+            max_finding_sim, similar_findings = self._top_similar(
+                "finding", task_embedding, "finding"
+            )
             max_similarity = max(max_task_sim, max_finding_sim)
 
             # Calculate novelty score (inverse of similarity)
             novelty_score = 1.0 - max_similarity
 
-            # Identify similar tasks (above 0.6 similarity)
-            similar_tasks = []
-            if task_similarities:
-                for i, sim in enumerate(task_similarities):
-                    if sim > 0.6:
-                        similar_tasks.append({
-                            "task": self.task_metadata[i],
-                            "similarity": round(float(sim), 3)
-                        })
-
-            # Identify similar findings
-            similar_findings = []
-            if finding_similarities:
-                for i, sim in enumerate(finding_similarities):
-                    if sim > 0.6:
-                        similar_findings.append({
-                            "finding": self.finding_metadata[i],
-                            "similarity": round(float(sim), 3)
-                        })
-
-            # Sort by similarity
-            similar_tasks.sort(key=lambda x: x["similarity"], reverse=True)
-            similar_findings.sort(key=lambda x: x["similarity"], reverse=True)
-
-            # Limit to top 3
-            similar_tasks = similar_tasks[:3]
-            similar_findings = similar_findings[:3]
-
             is_novel = max_similarity < self.novelty_threshold
 
             logger.debug(
@@ -264,6 +887,65 @@ class NoveltyDetector:
             # Fall back to keyword matching
             return self._check_novelty_keywords(text, task)
 
+    @staticmethod
+    def _similar_items(
+        similarities: np.ndarray,
+        metadata: List[Dict],
+        key: str,
+        threshold: float = 0.6
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-3 indexed items with similarity above the threshold, most
+        similar first.
+
+        argpartition keeps the selection O(N) in C instead of a Python
+        filter loop plus full sort; dicts are only materialized for the
+        (at most 3) rows actually returned.
+        """
+        if similarities.size == 0:
+            return []
+        k = min(3, similarities.size)
+        top_idx = np.argpartition(-similarities, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-similarities[top_idx])]
+        top_idx = top_idx[similarities[top_idx] > threshold]
+        return [
+            {key: metadata[int(i)], "similarity": round(float(similarities[i]), 3)}
+            for i in top_idx
+        ]
+
+    @staticmethod
+    def _similar_items_batch(
+        sims: np.ndarray,
+        metadata: List[Dict],
+        key: str
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        _similar_items for every row of a (P, N) similarity matrix.
+
+        One axis-wise argpartition/argsort replaces P per-row selections;
+        Python only materializes the few surviving dicts per row.
+        """
+        n_rows, n_cols = sims.shape
+        if n_cols == 0:
+            return [[] for _ in range(n_rows)]
+        k = min(3, n_cols)
+        if n_cols > k:
+            top_idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        else:
+            top_idx = np.tile(np.arange(n_cols), (n_rows, 1))
+        top_sims = np.take_along_axis(sims, top_idx, axis=1)
+        order = np.argsort(-top_sims, axis=1)
+        top_idx = np.take_along_axis(top_idx, order, axis=1)
+        top_sims = np.take_along_axis(top_sims, order, axis=1)
+        return [
+            [
+                {key: metadata[int(i)], "similarity": round(float(s), 3)}
+                for i, s in zip(top_idx[p], top_sims[p])
+                if s > 0.6
+            ]
+            for p in range(n_rows)
+        ]
+
     def _check_novelty_keywords(
         self,
         text: str,
@@ -274,22 +956,26 @@ class NoveltyDetector:
 
         This is less accurate than embeddings but works without dependencies.
         """
+        if NUMBA_AVAILABLE and (self._task_hashes or self._finding_hashes):
+            return self._check_novelty_keywords_jit(text, task)
+
         text_lower = text.lower()
         text_words = set(text_lower.split())
 
-        # Check against past tasks
+        n_query_words = len(text_words)
+
+        # Check against past tasks: token sets are precomputed at index
+        # time, so each row is one intersection plus size arithmetic
+        # (Jaccard: |A∩B| / (|A| + |B| - |A∩B|), no union set built)
         max_similarity = 0.0
         similar_tasks = []
 
-        for i, past_text in enumerate(self.task_texts):
-            past_words = set(past_text.lower().split())
-
-            # Jaccard similarity
-            intersection = text_words & past_words
-            union = text_words | past_words
+        for i, past_words in enumerate(self.task_word_sets):
+            intersection = len(text_words & past_words)
+            union = n_query_words + len(past_words) - intersection
 
-            if len(union) > 0:
-                similarity = len(intersection) / len(union)
+            if union > 0:
+                similarity = intersection / union
 
                 if similarity > max_similarity:
                     max_similarity = similarity
@@ -302,14 +988,12 @@ class NoveltyDetector:
 
         # Check against findings
         similar_findings = []
-        for i, finding_text in enumerate(self.finding_texts):
-            finding_words = set(finding_text.lower().split())
-
-            intersection = text_words & finding_words
-            union = text_words | finding_words
+        for i, finding_words in enumerate(self.finding_word_sets):
+            intersection = len(text_words & finding_words)
+            union = n_query_words + len(finding_words) - intersection
 
-            if len(union) > 0:
-                similarity = len(intersection) / len(union)
+            if union > 0:
+                similarity = intersection / union
 
                 if similarity > max_similarity:
                     max_similarity = similarity
@@ -343,6 +1027,57 @@ class NoveltyDetector:
             "method": "keywords"
         }
 
+    def _check_novelty_keywords_jit(
+        self,
+        text: str,
+        task: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Keyword novelty check via the compiled Jaccard kernel.
+
+        Token hashes are sorted uint64 arrays prepared at index time, so
+        each query is a two-pointer merge per row in machine code instead
+        of Python-level set intersections.
+        """
+        query = _token_hashes(text)
+
+        task_sims = np.empty(0, dtype=np.float32)
+        if self._task_hashes:
+            if self._task_pack is None:
+                self._task_pack = self._pack_hashes(self._task_hashes)
+            task_sims = _jaccard_batch(query, *self._task_pack)
+
+        finding_sims = np.empty(0, dtype=np.float32)
+        if self._finding_hashes:
+            if self._finding_pack is None:
+                self._finding_pack = self._pack_hashes(self._finding_hashes)
+            finding_sims = _jaccard_batch(query, *self._finding_pack)
+
+        max_task_sim = float(task_sims.max()) if task_sims.size else 0.0
+        max_finding_sim = float(finding_sims.max()) if finding_sims.size else 0.0
+        max_similarity = max(max_task_sim, max_finding_sim)
+
+        novelty_score = 1.0 - max_similarity
+        is_novel = max_similarity < (self.novelty_threshold - 0.2)  # Lower threshold for keywords
+
+        logger.debug(
+            f"Task novelty check (keywords): max_sim={max_similarity:.3f}, "
+            f"novel={is_novel}"
+        )
+
+        return {
+            "is_novel": is_novel,
+            "max_similarity": round(max_similarity, 3),
+            "novelty_score": round(novelty_score, 3),
+            "similar_tasks": self._similar_items(
+                task_sims, self.task_metadata, "task", threshold=0.4
+            ),
+            "similar_findings": self._similar_items(
+                finding_sims, self.finding_metadata, "finding", threshold=0.4
+            ),
+            "method": "keywords"
+        }
+
     def check_plan_novelty(
         self,
         plan: Dict[str, Any]
@@ -370,18 +1105,26 @@ class NoveltyDetector:
                 "task_novelty_details": []
             }
 
-        # Check each task
-        task_novelty_details = []
-        novelty_scores = []
+        # Check each task: one batched encode + two GEMMs when embeddings
+        # are available, falling back to per-task checks otherwise
+        task_novelty_details = None
+        if self.use_embeddings and (self._n_tasks or self._n_findings):
+            try:
+                task_novelty_details = self._check_plan_novelty_embeddings(tasks)
+            except Exception as e:
+                logger.error(f"Batched plan novelty check failed: {e}")
 
-        for task in tasks:
-            novelty_check = self.check_task_novelty(task)
-            task_novelty_details.append({
-                "task_id": task.get("id"),
-                "task_description": task.get("description"),
-                **novelty_check
-            })
-            novelty_scores.append(novelty_check["novelty_score"])
+        if task_novelty_details is None:
+            task_novelty_details = []
+            for task in tasks:
+                novelty_check = self.check_task_novelty(task)
+                task_novelty_details.append({
+                    "task_id": task.get("id"),
+                    "task_description": task.get("description"),
+                    **novelty_check
+                })
+
+        novelty_scores = [check["novelty_score"] for check in task_novelty_details]
 
         # Calculate statistics
         average_novelty = sum(novelty_scores) / len(novelty_scores)
@@ -400,12 +1143,95 @@ class NoveltyDetector:
             "task_novelty_details": task_novelty_details
         }
 
-    def save_index(self, filepath: str):
+    def _check_plan_novelty_embeddings(
+        self,
+        tasks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Check every task of a plan in one batch.
+
+        Encoding the whole plan in a single model.encode call amortizes
+        tokenizer and forward-pass overhead that a per-task encode pays P
+        times, and the similarity step collapses to two GEMMs. Texts are
+        encoded in length order (sentence-transformers pads each batch to
+        its longest member) and restored to plan order afterwards.
+
+        Args:
+            tasks: The plan's task dicts
+
+        Returns:
+            Per-task novelty detail dicts, in plan order
+        """
+        texts = [
+            f"{task.get('type', 'unknown')}: {task.get('description', '')}"
+            for task in tasks
+        ]
+
+        # Encode only cache misses, deduplicated (plans may repeat a task
+        # text), in one batch
+        unique_texts = list(dict.fromkeys(texts))
+        misses = [t for t in unique_texts if t not in self._query_emb_cache]
+        if misses:
+            order = np.argsort([len(t) for t in misses], kind="stable")
+            encoded = self._encode([misses[i] for i in order])
+            for pos, i in enumerate(order):
+                self._cache_query_embedding(misses[i], encoded[pos])
+
+        # _get_or_encode covers the rare case of an entry evicted between
+        # the fill above and this read
+        cache = self._query_emb_cache
+        query_embs = np.stack([
+            cache[t] if t in cache else self._get_or_encode(t)
+            for t in texts
+        ])
+
+        if self._n_tasks:
+            task_sims = self._corpus_similarity("task", query_embs)
+        else:
+            task_sims = np.empty((len(tasks), 0), dtype=np.float32)
+        if self._n_findings:
+            finding_sims = self._corpus_similarity("finding", query_embs)
+        else:
+            finding_sims = np.empty((len(tasks), 0), dtype=np.float32)
+
+        # All P reductions as axis-wise array ops; the loop below only
+        # assembles the result dicts
+        zeros = np.zeros(len(tasks), dtype=np.float32)
+        max_task = task_sims.max(axis=1) if task_sims.shape[1] else zeros
+        max_finding = finding_sims.max(axis=1) if finding_sims.shape[1] else zeros
+        max_sims = np.maximum(max_task, max_finding)
+        novel_flags = max_sims < self.novelty_threshold
+        similar_tasks = self._similar_items_batch(task_sims, self.task_metadata, "task")
+        similar_findings = self._similar_items_batch(
+            finding_sims, self.finding_metadata, "finding"
+        )
+
+        return [
+            {
+                "task_id": task.get("id"),
+                "task_description": task.get("description"),
+                "is_novel": bool(novel_flags[p]),
+                "max_similarity": round(float(max_sims[p]), 3),
+                "novelty_score": round(1.0 - float(max_sims[p]), 3),
+                "similar_tasks": similar_tasks[p],
+                "similar_findings": similar_findings[p],
+                "method": "embeddings"
+            }
+            for p, task in enumerate(tasks)
+        ]
+
+    def save_index(self, filepath: str, compress: bool = False):
         """
         Save vector index to disk.
 
         Args:
             filepath: Path to save index
+            compress: Write both embedding matrices as one zip-deflated
+                     .npz instead of raw .npy files. Cuts index files
+                     roughly in half again on top of quantization (fp32
+                     indexes are cast to fp16 first — sub-0.001 cosine
+                     loss on normalized rows), at the cost of losing
+                     memory-mapped loads.
         """
         index_data = {
             "task_texts": self.task_texts,
@@ -425,18 +1251,33 @@ class NoveltyDetector:
             with open(filepath, "w") as f:
                 json.dump(index_data, f, indent=2)
 
-            # Save embeddings as numpy arrays
-            if self.task_embeddings:
-                np.save(
-                    str(index_path.parent / f"{index_path.stem}_task_embeddings.npy"),
-                    np.array(self.task_embeddings)
-                )
-
-            if self.finding_embeddings:
-                np.save(
-                    str(index_path.parent / f"{index_path.stem}_finding_embeddings.npy"),
-                    np.array(self.finding_embeddings)
-                )
+            # Save embeddings as numpy arrays (live rows only, not spare
+            # capacity); remove the other format's files so a later load
+            # can't pick up a stale sibling
+            task_npy = index_path.parent / f"{index_path.stem}_task_embeddings.npy"
+            finding_npy = index_path.parent / f"{index_path.stem}_finding_embeddings.npy"
+            npz_path = index_path.parent / f"{index_path.stem}_embeddings.npz"
+
+            if compress:
+                arrays = {}
+                if self._n_tasks:
+                    arrays["task"] = self._compressible(
+                        self.task_emb_matrix[:self._n_tasks]
+                    )
+                if self._n_findings:
+                    arrays["finding"] = self._compressible(
+                        self.finding_emb_matrix[:self._n_findings]
+                    )
+                if arrays:
+                    np.savez_compressed(str(npz_path), **arrays)
+                task_npy.unlink(missing_ok=True)
+                finding_npy.unlink(missing_ok=True)
+            else:
+                if self._n_tasks:
+                    np.save(str(task_npy), self.task_emb_matrix[:self._n_tasks])
+                if self._n_findings:
+                    np.save(str(finding_npy), self.finding_emb_matrix[:self._n_findings])
+                npz_path.unlink(missing_ok=True)
 
             logger.info(f"Saved novelty index to {filepath}")
         else:
@@ -468,27 +1309,113 @@ class NoveltyDetector:
         self.finding_texts = index_data.get("finding_texts", [])
         self.finding_metadata = index_data.get("finding_metadata", [])
 
+        # Token sets and hash arrays are derived, not persisted; rebuild
+        self.task_word_sets = [frozenset(t.lower().split()) for t in self.task_texts]
+        self.finding_word_sets = [frozenset(t.lower().split()) for t in self.finding_texts]
+        self._task_hashes = [_token_hashes(t) for t in self.task_texts]
+        self._finding_hashes = [_token_hashes(t) for t in self.finding_texts]
+        self._task_pack = None
+        self._finding_pack = None
+        self._task_ann = None
+        self._finding_ann = None
+        self._task_gpu = None
+        self._finding_gpu = None
+        self._task_mean = None
+        self._task_dev = 0.0
+        self._finding_mean = None
+        self._finding_dev = 0.0
+
         # Load embeddings if available
         if index_data.get("use_embeddings") and self.use_embeddings:
+            npz_path = index_path.parent / f"{index_path.stem}_embeddings.npz"
+            if npz_path.exists():
+                with np.load(str(npz_path)) as data:
+                    if "task" in data:
+                        self.task_emb_matrix = self._coerce_matrix(data["task"])
+                        self._n_tasks = self.task_emb_matrix.shape[0]
+                        logger.info(f"Loaded {self._n_tasks} task embeddings")
+                    if "finding" in data:
+                        self.finding_emb_matrix = self._coerce_matrix(data["finding"])
+                        self._n_findings = self.finding_emb_matrix.shape[0]
+                        logger.info(f"Loaded {self._n_findings} finding embeddings")
+                logger.info(f"Loaded novelty index from {filepath}")
+                return
+
             task_emb_path = index_path.parent / f"{index_path.stem}_task_embeddings.npy"
             finding_emb_path = index_path.parent / f"{index_path.stem}_finding_embeddings.npy"
 
             if task_emb_path.exists():
-                self.task_embeddings = list(np.load(str(task_emb_path)))
-                logger.info(f"Loaded {len(self.task_embeddings)} task embeddings")
+                self.task_emb_matrix = self._load_matrix(task_emb_path)
+                self._n_tasks = self.task_emb_matrix.shape[0]
+                logger.info(f"Loaded {self._n_tasks} task embeddings")
 
             if finding_emb_path.exists():
-                self.finding_embeddings = list(np.load(str(finding_emb_path)))
-                logger.info(f"Loaded {len(self.finding_embeddings)} finding embeddings")
+                self.finding_emb_matrix = self._load_matrix(finding_emb_path)
+                self._n_findings = self.finding_emb_matrix.shape[0]
+                logger.info(f"Loaded {self._n_findings} finding embeddings")
 
         logger.info(f"Loaded novelty index from {filepath}")
 
+    @staticmethod
+    def _compressible(rows: np.ndarray) -> np.ndarray:
+        """
+        Rows as written to a compressed archive: quantized dtypes go out
+        as-is, fp32 drops to fp16 (normalized rows lose <0.001 cosine).
+        """
+        if rows.dtype == np.float32:
+            return rows.astype(np.float16)
+        return rows
+
+    def _load_matrix(self, path: Path) -> np.ndarray:
+        """
+        Load a saved embedding matrix into the configured index dtype.
+
+        int8 rows, and fp16 rows matching the configured precision, are
+        already quantized unit vectors and are served memory-mapped
+        without a copy; fp32 rows are re-normalized (indexes saved before
+        encode-time normalization) and quantized to the configured
+        precision.
+        """
+        # Quantized saves are already normalized unit vectors in their
+        # final dtype: serve them memory-mapped so load_index costs no
+        # copy and pages are only faulted in as similarity touches
+        # them. The first append reallocates into a writable matrix.
+        return self._coerce_matrix(np.load(str(path), mmap_mode="r"))
+
+    def _coerce_matrix(self, loaded: np.ndarray) -> np.ndarray:
+        """Bring loaded rows to the configured index dtype (see _load_matrix)."""
+        if loaded.dtype == np.int8 or (
+            loaded.dtype == self.embedding_dtype and loaded.dtype == np.float16
+        ):
+            return loaded
+        # astype always copies, so in-place normalization never touches
+        # a read-only map
+        floats = self._normalize_rows(loaded.astype(np.float32))
+        return np.ascontiguousarray(self._quantize(floats))
+
     def reset(self):
         """Clear all indexed data."""
-        self.task_embeddings.clear()
+        self.task_emb_matrix = None
+        self._n_tasks = 0
         self.task_texts.clear()
+        self.task_word_sets.clear()
         self.task_metadata.clear()
-        self.finding_embeddings.clear()
+        self.finding_emb_matrix = None
+        self._n_findings = 0
         self.finding_texts.clear()
+        self.finding_word_sets.clear()
         self.finding_metadata.clear()
+        self._task_hashes.clear()
+        self._finding_hashes.clear()
+        self._task_pack = None
+        self._finding_pack = None
+        self._task_ann = None
+        self._finding_ann = None
+        self._task_gpu = None
+        self._finding_gpu = None
+        self._task_mean = None
+        self._task_dev = 0.0
+        self._finding_mean = None
+        self._finding_dev = 0.0
+        self._query_emb_cache.clear()
         logger.info("Reset novelty detector")
@@ -206,7 +206,7 @@ class CodeValidator:
 
         # Create report
         passed = len(violations) == 0
-        report = SafetyReport(
+        report = SafetyReport.model_construct(
             passed=passed,
             risk_level=risk_level,
             violations=violations,
@@ -231,7 +231,7 @@ class CodeValidator:
         try:
             ast.parse(code)
         except SyntaxError as e:
-            violations.append(SafetyViolation(
+            violations.append(SafetyViolation.model_construct(
                 type=ViolationType.DANGEROUS_CODE,
                 severity=RiskLevel.HIGH,
                 message=f"Syntax error: {e}",
@@ -249,7 +249,7 @@ class CodeValidator:
                 if isinstance(node, ast.Import):
                     for alias in node.names:
                         if alias.name in self.DANGEROUS_MODULES or any(alias.name.startswith(f"{m}.") for m in self.DANGEROUS_MODULES):
-                            violations.append(SafetyViolation(
+                            violations.append(SafetyViolation.model_construct(
                                 type=ViolationType.DANGEROUS_CODE,
                                 severity=RiskLevel.CRITICAL,
                                 message=f"Dangerous import detected: {alias.name}",
@@ -257,7 +257,7 @@ class CodeValidator:
                             ))
                 elif isinstance(node, ast.ImportFrom):
                     if node.module and (node.module in self.DANGEROUS_MODULES or any(node.module.startswith(f"{m}.") for m in self.DANGEROUS_MODULES)):
-                        violations.append(SafetyViolation(
+                        violations.append(SafetyViolation.model_construct(
                             type=ViolationType.DANGEROUS_CODE,
                             severity=RiskLevel.CRITICAL,
                             message=f"Dangerous import detected: from {node.module}",
@@ -267,7 +267,7 @@ class CodeValidator:
             # Fall back to string matching if code has syntax errors
             for module in self.DANGEROUS_MODULES:
                 if f"import {module}" in code or f"from {module}" in code:
-                    violations.append(SafetyViolation(
+                    violations.append(SafetyViolation.model_construct(
                         type=ViolationType.DANGEROUS_CODE,
                         severity=RiskLevel.CRITICAL,
                         message=f"Dangerous import detected: {module}",
@@ -289,7 +289,7 @@ class CodeValidator:
                     elif self.allow_file_read:
                         # Check if it's read-only (contains "'r'" or no mode specified)
                         if any(mode in code for mode in ["'w'", "'a'", "'x'", "mode='w'", 'mode="w"']):
-                            violations.append(SafetyViolation(
+                            violations.append(SafetyViolation.model_construct(
                                 type=ViolationType.FILE_SYSTEM_ACCESS,
                                 severity=RiskLevel.HIGH,
                                 message="Write mode file operations not allowed",
@@ -298,14 +298,14 @@ class CodeValidator:
                         else:
                             warnings.append(f"File read operation detected: {pattern}")
                     else:
-                        violations.append(SafetyViolation(
+                        violations.append(SafetyViolation.model_construct(
                             type=ViolationType.FILE_SYSTEM_ACCESS,
                             severity=RiskLevel.HIGH,
                             message="File operations not allowed",
                             details={"pattern": pattern}
                         ))
                 else:
-                    violations.append(SafetyViolation(
+                    violations.append(SafetyViolation.model_construct(
                         type=ViolationType.DANGEROUS_CODE,
                         severity=RiskLevel.CRITICAL,
                         message=f"Dangerous operation detected: {pattern}",
@@ -344,7 +344,7 @@ class CodeValidator:
                 for keyword in guideline.keywords:
                     if keyword.lower() in text_to_check:
                         if guideline.required:
-                            violations.append(SafetyViolation(
+                            violations.append(SafetyViolation.model_construct(
                                 type=ViolationType.ETHICAL_VIOLATION,
                                 severity=guideline.severity_if_violated,
                                 message=f"Potential ethical violation: {guideline.description}",
@@ -20,7 +20,7 @@ from contextlib import contextmanager
 
 from kosmos.models.safety import (
     SafetyReport, SafetyIncident, ViolationType, RiskLevel,
-    ResourceLimit, EmergencyStopStatus
+    ResourceLimit, EmergencyStopStatus, dump_incident
 )
 from kosmos.utils.compat import model_to_dict
 from kosmos.safety.code_validator import CodeValidator
@@ -346,7 +346,7 @@ class SafetyGuardrails:
         # Write to log file (JSONL format)
         try:
             with open(self.incident_log_path, 'a') as f:
-                f.write(json.dumps(model_to_dict(incident), default=str) + '\n')
+                f.write(json.dumps(dump_incident(incident), default=str) + '\n')
             logger.info(f"Safety incident logged: {incident.incident_id}")
         except Exception as e:
             logger.error(f"Error logging incident: {e}")
@@ -4,6 +4,7 @@ This module provides compatibility wrappers to handle differences between
 Pydantic v1 and v2, allowing the codebase to work with either version.
 """
 
+import dataclasses
 from typing import Any, Dict
 
 
@@ -36,7 +37,15 @@ def model_to_dict(model: Any, **kwargs) -> Dict[str, Any]:
     # Fall back to Pydantic v1 method
     elif hasattr(model, 'dict'):
         return model.dict(**kwargs)
-    # Handle plain objects or dataclasses
+    # Handle dataclasses (including slotted ones, which have no __dict__);
+    # shallow like the __dict__ branch, skipping private bookkeeping fields
+    elif dataclasses.is_dataclass(model):
+        return {
+            f.name: getattr(model, f.name)
+            for f in dataclasses.fields(model)
+            if not f.name.startswith('_')
+        }
+    # Handle plain objects
     elif hasattr(model, '__dict__'):
         return dict(model.__dict__)
     # Last resort - try to convert directly
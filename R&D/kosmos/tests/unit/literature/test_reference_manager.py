@@ -0,0 +1,119 @@
+"""
+Tests for the reference manager.
+
+Covers search over the reference collection, including the inverted-index
+fast path and its fallback for partial-word queries.
+"""
+
+import pytest
+
+from kosmos.literature.base_client import PaperMetadata, PaperSource
+from kosmos.literature.reference_manager import ReferenceManager
+
+
+def _paper(paper_id: str, title: str, abstract: str = "Test abstract", **kwargs) -> PaperMetadata:
+    return PaperMetadata(
+        id=paper_id,
+        source=PaperSource.ARXIV,
+        title=title,
+        abstract=abstract,
+        authors=[],
+        **kwargs
+    )
+
+
+class TestJsonlMergePersistence:
+    """Tests that duplicate merges survive a JSONL storage round trip."""
+
+    def test_merge_is_appended_and_survives_reload(self, tmp_path):
+        """Regression test: the merge path never appended the merged
+        record, so enrichment from a duplicate was lost on reload."""
+        storage = tmp_path / "library.jsonl"
+        manager = ReferenceManager(storage_path=str(storage))
+
+        ref_id = manager.add_reference(
+            _paper("p1", "Quantum Entanglement Basics", abstract="", doi="10.1/x")
+        )
+        # Enriched duplicate: same DOI, now with abstract and citations
+        merged_id = manager.add_reference(
+            _paper("p1b", "Quantum Entanglement Basics",
+                   abstract="A primer on entanglement.",
+                   doi="10.1/x", citation_count=99)
+        )
+        manager.add_reference(_paper("p2", "Another Paper", doi="10.1/y"))
+
+        assert merged_id == ref_id
+
+        reloaded = ReferenceManager(storage_path=str(storage))
+        paper = reloaded.get_reference(ref_id)
+
+        assert len(reloaded.references) == 2
+        assert paper.abstract == "A primer on entanglement."
+        assert paper.citation_count == 99
+
+    def test_batch_merge_survives_reload(self, tmp_path):
+        """Test that the add_references merge branch also persists."""
+        storage = tmp_path / "library.jsonl"
+        manager = ReferenceManager(storage_path=str(storage))
+        manager.add_reference(
+            _paper("p1", "Quantum Entanglement Basics", abstract="", doi="10.1/x")
+        )
+
+        manager.add_references([
+            _paper("p1b", "Quantum Entanglement Basics",
+                   abstract="A primer on entanglement.",
+                   doi="10.1/x", citation_count=99),
+            _paper("p2", "Another Paper", doi="10.1/y"),
+        ])
+
+        reloaded = ReferenceManager(storage_path=str(storage))
+        merged = [p for p in reloaded.references.values() if p.doi == "10.1/x"]
+
+        assert len(reloaded.references) == 2
+        assert len(merged) == 1
+        assert merged[0].citation_count == 99
+
+
+class TestSearchReferences:
+    """Tests for ReferenceManager.search_references."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = ReferenceManager(auto_deduplicate=False)
+        manager.add_references([
+            _paper("p1", "Quantum Entanglement Basics"),
+            _paper("p2", "Machine Learning for Protein Folding"),
+            _paper("p3", "Deep Learning Advances", abstract="Neural networks"),
+        ])
+        return manager
+
+    def test_whole_word_query_matches(self, manager):
+        """Test that a whole-word query finds its paper."""
+        results = manager.search_references("quantum")
+
+        assert [p.title for p in results] == ["Quantum Entanglement Basics"]
+
+    def test_multi_word_query_matches(self, manager):
+        """Test that a multi-word query narrows via the token index."""
+        results = manager.search_references("machine learning")
+
+        assert [p.title for p in results] == ["Machine Learning for Protein Folding"]
+
+    def test_partial_word_query_falls_back_to_scan(self, manager):
+        """Regression test: a word fragment has no token posting but must
+        still match by substring (it returned [] when the index
+        intersection short-circuited on the missing posting)."""
+        results = manager.search_references("quant")
+
+        assert [p.title for p in results] == ["Quantum Entanglement Basics"]
+
+    def test_no_match_returns_empty(self, manager):
+        """Test that an unrelated query returns no results."""
+        assert manager.search_references("astrophysics") == []
+
+    def test_search_respects_fields(self, manager):
+        """Test that matches outside the requested fields are excluded."""
+        assert manager.search_references("neural", fields=["title"]) == []
+        results = manager.search_references("neural", fields=["abstract"])
+
+        assert [p.title for p in results] == ["Deep Learning Advances"]
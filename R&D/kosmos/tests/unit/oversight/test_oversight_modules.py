@@ -19,6 +19,14 @@ from kosmos.models.safety import ApprovalRequest, ApprovalStatus, RiskLevel
 
 # ========== Human Review Workflow Tests ==========
 
+@pytest.fixture(autouse=True)
+def _isolate_audit_log(tmp_path, monkeypatch):
+    """Run each test from tmp_path so workflows built with the default
+    audit_log_path append to a throwaway human_review_audit.jsonl instead
+    of the tracked one in the repo root."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestHumanReviewInit:
     """Tests for HumanReviewWorkflow initialization."""
 
@@ -151,6 +159,60 @@ class TestPendingRequestProcessing:
         assert processed[0].status == ApprovalStatus.REJECTED
 
 
+class TestApprovalRequestExpiry:
+    """Tests for ApprovalRequest expiry deadlines."""
+
+    def _request(self, **overrides):
+        fields = dict(
+            request_id="test_123",
+            operation_type="test",
+            operation_description="Test op",
+            risk_level=RiskLevel.MEDIUM,
+            reason_for_approval="Testing"
+        )
+        fields.update(overrides)
+        return ApprovalRequest(**fields)
+
+    def test_fresh_request_not_expired(self):
+        """Test that a just-created request is within its timeout."""
+        request = self._request(timeout_seconds=3600)
+
+        assert request.is_expired() is False
+
+    def test_backdated_request_is_expired(self):
+        """Test that the deadline anchors to the stored timestamp."""
+        request = self._request(
+            timestamp=datetime.now() - timedelta(hours=5),
+            timeout_seconds=3600
+        )
+
+        assert request.is_expired() is True
+
+        request.mark_expired()
+        assert request.status == ApprovalStatus.EXPIRED
+
+    def test_rehydrated_request_keeps_original_deadline(self):
+        """Test that a model_dump round trip does not refresh the timeout."""
+        stale = self._request(
+            timestamp=datetime.now() - timedelta(hours=2),
+            timeout_seconds=3600
+        )
+
+        rehydrated = ApprovalRequest(**stale.model_dump())
+
+        assert rehydrated.is_expired() is True
+
+    def test_non_pending_request_never_expires(self):
+        """Test that resolved requests are not reported as expired."""
+        request = self._request(
+            timestamp=datetime.now() - timedelta(hours=5),
+            timeout_seconds=3600
+        )
+        request.approve("reviewer")
+
+        assert request.is_expired() is False
+
+
 class TestOverrideCapability:
     """Tests for approval decision override."""
 